@@ -12,6 +12,16 @@ setup(
         "python-dotenv",
         "openai",
         "aspose-words",  # if you're using Aspose
+        "beautifulsoup4",
+        "numpy",
+        "requests",
+        "tiktoken",
+        "diskcache",
+        "httpx[http2]",
+        "orjson",
         # Add any other libraries you're using
     ],
+    extras_require={
+        "local-embeddings": ["fastembed"],
+    },
 )
@@ -16,6 +16,11 @@ class Config:
     TRANSLATION_MODEL = "gpt-4o"  # the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
     VALIDATION_MODEL = "gpt-4o"
     EMBEDDING_MODEL = "text-embedding-3-small"
+    # "openai" or "local" (FastEmbed ONNX model, no API key or network round-trip)
+    EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai")
+    LOCAL_EMBEDDING_MODEL = os.getenv(
+        "LOCAL_EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    )
     
     # Processing settings
     MAX_TOKENS_PER_REQUEST = 2000
@@ -47,7 +52,7 @@ class Config:
         if not cls.AZURE_OPENAI_ENDPOINT:
             issues.append("AZURE_OPENAI_ENDPOINT not configured")
         
-        if not cls.OPENAI_API_KEY:
+        if not cls.OPENAI_API_KEY and cls.EMBEDDING_BACKEND != "local":
             issues.append("OPENAI_API_KEY not configured (required for embeddings)")
         
         return {
@@ -62,7 +67,7 @@ class Config:
         return {
             'translation_model': cls.TRANSLATION_MODEL,
             'validation_model': cls.VALIDATION_MODEL,
-            'embedding_model': cls.EMBEDDING_MODEL,
+            'embedding_model': cls.LOCAL_EMBEDDING_MODEL if cls.EMBEDDING_BACKEND == "local" else cls.EMBEDDING_MODEL,
             'max_file_size_mb': cls.MAX_FILE_SIZE_MB,
             'supported_formats': cls.SUPPORTED_FORMATS,
             'azure_endpoint_configured': bool(cls.AZURE_OPENAI_ENDPOINT),
@@ -3,8 +3,9 @@ Interface definitions for CVE Translation System
 Defines contracts for all major components
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from .models import TranslationRequest, TranslationResponse, ValidationResult
 
 
@@ -16,6 +17,32 @@ class ITranslator(ABC):
         """Translate text from source to target language"""
         pass
     
+    async def translate_async(self, request: TranslationRequest) -> TranslationResponse:
+        """Translate text without blocking the event loop (defaults to a worker thread)"""
+        return await asyncio.to_thread(self.translate, request)
+    
+    async def translate_many_async(
+        self,
+        requests: List[TranslationRequest],
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> List[TranslationResponse]:
+        """Translate several requests, preserving order (defaults to one call per request)"""
+        completed = 0
+        
+        async def run(request: TranslationRequest) -> TranslationResponse:
+            nonlocal completed
+            response = await self.translate_async(request)
+            completed += 1
+            if progress_callback:
+                progress_callback(completed)
+            return response
+        
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+    
+    def run_async(self, coroutine):
+        """Run coroutine from synchronous code, releasing any per-loop resources afterwards"""
+        return asyncio.run(coroutine)
+    
     @abstractmethod
     def supports_language_pair(self, source: str, target: str) -> bool:
         """Check if translator supports the language pair"""
@@ -45,8 +72,12 @@ class IDocumentProcessor(ABC):
         pass
     
     @abstractmethod
-    def extract_content(self, file_content: bytes) -> Dict[str, Any]:
-        """Extract translatable content from document"""
+    def extract_content(
+        self,
+        file_content: bytes,
+        on_block: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """Extract translatable content from document, passing each block to on_block as it is parsed"""
         pass
     
     @abstractmethod
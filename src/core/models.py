@@ -4,9 +4,11 @@ Defines request/response models and data structures
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class LanguageCode(Enum):
     """Supported language codes"""
@@ -29,7 +31,7 @@ class TranslationQuality(Enum):
     POOR = "poor"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranslationRequest:
     """Request model for translation operations"""
     text: str
@@ -40,7 +42,7 @@ class TranslationRequest:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResponse:
     """Response model for translation operations"""
     translated_text: str
@@ -52,7 +54,7 @@ class TranslationResponse:
     processing_time: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result model for translation validation"""
     similarity_score: float
@@ -63,7 +65,7 @@ class ValidationResult:
     suggestions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentContent:
     """Model for extracted document content"""
     content_blocks: List[Dict[str, Any]]
@@ -77,7 +79,31 @@ class DocumentContent:
     hyperlinks: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
+class ContentBatch:
+    """Columnar view of content blocks: parallel id and text lists plus a translatable mask"""
+    ids: List[str]
+    texts: List[str]
+    translatable: np.ndarray
+
+    @classmethod
+    def from_blocks(cls, content_blocks: List[Dict[str, Any]]) -> "ContentBatch":
+        """Build a batch from processor content blocks in a single pass"""
+        ids = []
+        texts = []
+        translatable = np.zeros(len(content_blocks), dtype=np.bool_)
+        for index, block in enumerate(content_blocks):
+            ids.append(block['id'])
+            texts.append(block['text'])
+            translatable[index] = block.get('translatable', False)
+        return cls(ids=ids, texts=texts, translatable=translatable)
+
+    def translatable_indices(self) -> np.ndarray:
+        """Positions of the blocks that should be translated"""
+        return np.flatnonzero(self.translatable)
+
+
+@dataclass(slots=True)
 class ProcessingResult:
     """Result model for document processing operations"""
     success: bool
@@ -88,7 +114,7 @@ class ProcessingResult:
     processing_stats: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CVETerms:
     """Model for CVE-specific technical terms"""
     cve_ids: List[str] = field(default_factory=list)
@@ -99,14 +125,35 @@ class CVETerms:
     technical_identifiers: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationConfig:
     """Configuration model for translation operations"""
     model_name: str = "gpt-4o"
     temperature: float = 0.1
     max_tokens: int = 2000
     batch_size: int = 10
+    # (prompt tokens below, concurrent requests, timeout seconds) per length bucket;
+    # requests larger than the last threshold use the last bucket
+    length_buckets: Tuple[Tuple[int, int, int], ...] = (
+        (256, 64, 30),
+        (2048, 32, 90),
+        (8192, 8, 300)
+    )
+    max_blocks_per_request: int = 12
+    stream_responses: bool = True
+    # In-flight requests when one long or oversized block is translated in pieces
+    piece_concurrency: int = 16
+    # Multi-paragraph texts above this many tokens are split at paragraph breaks; 0 disables
+    parallel_chunk_tokens: int = 500
+    # Idle seconds before the pooled connection is pinged to keep it warm; 0 disables
+    keepalive_interval_seconds: int = 40
+    enable_cache: bool = True
+    cache_directory: str = ".translation_cache"
     enable_validation: bool = True
     preserve_formatting: bool = True
     quality_threshold: float = 0.7
-    timeout_seconds: int = 60
\ No newline at end of file
+    # Short blocks up to this length skip embedding validation when lengths and terms check out
+    trivial_validation_max_chars: int = 40
+    timeout_seconds: int = 60
+    # Retries per request on rate limits and transient server errors
+    max_retries: int = 3
\ No newline at end of file
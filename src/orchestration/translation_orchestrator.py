@@ -3,20 +3,74 @@ Translation Orchestrator
 Main orchestration service that coordinates all components for translation workflows
 """
 
+import re
 import time
-from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+from typing import Dict, Any, List, Optional, Callable, Tuple, TYPE_CHECKING
 
 from core.interfaces import ITranslator, IValidator, IDocumentProcessor, ITermPreserver
 from core.models import (
     TranslationRequest, 
     TranslationResponse, 
     ValidationResult,
+    TranslationQuality,
     ProcessingResult,
+    ContentBatch,
     TranslationConfig,
     LanguageCode
 )
-from core.exceptions import CVETranslationError, ProcessingError
+from core.exceptions import CVETranslationError, ProcessingError, TranslationServiceError
+
+if TYPE_CHECKING:
+    from providers.translation_cache import TranslationCache
+
+
+# Any run of letters left after removing technical terms means the text had prose to translate
+WORD_PATTERN = re.compile(r"[A-Za-z]{3,}")
+
+
+class BatchScheduler:
+    """Request limits and in-flight translations shared by the batches of one job
+    
+    Each length bucket bounds its own in-flight requests and timeout, so short
+    blocks run wide while long prefills cannot starve or time them out. Texts
+    being translated are tracked so an identical block in a later batch waits
+    for the same response instead of sending its own request.
+    """
+    
+    def __init__(self, buckets: Tuple[Tuple[int, int, int], ...], max_concurrency: Optional[int] = None):
+        self.buckets = buckets
+        self.semaphores = [
+            asyncio.Semaphore(min(limit, max_concurrency) if max_concurrency else limit)
+            for _, limit, _ in buckets
+        ]
+        self.in_flight: Dict[str, asyncio.Future] = {}
+
+    def bucket_for(self, tokens: int) -> int:
+        """Index of the length bucket for a request of this many prompt tokens"""
+        for bucket_index, (max_tokens, _, _) in enumerate(self.buckets):
+            if tokens < max_tokens:
+                return bucket_index
+        return len(self.buckets) - 1
+
+    def claim(self, text: str) -> asyncio.Future:
+        """Register text as being translated and return the future its response settles"""
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[text] = future
+        return future
+
+    def settle(self, text: str, response: Optional[TranslationResponse] = None, error: Optional[Exception] = None):
+        """Hand a claimed text's response, or its error, to every batch waiting on it"""
+        future = self.in_flight.get(text)
+        if future is None or future.done():
+            return
+        if error is None:
+            future.set_result(response)
+            return
+        # Failed texts are released so a later batch retries them
+        del self.in_flight[text]
+        future.set_exception(error)
+        future.exception()  # Waiters re-raise it; nobody else needs it logged
 
 
 class TranslationOrchestrator:
@@ -27,12 +81,14 @@ class TranslationOrchestrator:
         translator: ITranslator,
         validator: IValidator,
         term_preserver: ITermPreserver,
-        config: TranslationConfig = None
+        config: TranslationConfig = None,
+        translation_cache: Optional["TranslationCache"] = None
     ):
         self.translator = translator
         self.validator = validator
         self.term_preserver = term_preserver
         self.config = config or TranslationConfig()
+        self.translation_cache = translation_cache
         
         # Processing statistics
         self.stats = {
@@ -49,113 +105,258 @@ class TranslationOrchestrator:
         source_lang: LanguageCode = LanguageCode.ENGLISH,
         target_lang: LanguageCode = LanguageCode.JAPANESE,
         validate: bool = True,
-        preserve_terms: bool = True
+        preserve_terms: bool = True,
+        on_delta: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
-        """Translate a single text with full workflow"""
+        """Translate a single text with full workflow
+        
+        on_delta receives fragments of the raw translation while it streams, so
+        callers can preview it before terms are restored and it is validated.
+        """
         
         start_time = time.time()
         
         try:
-            # Update total translations counter
-            self.stats['total_translations'] += 1
-            # Step 1: Prepare text and preserve technical terms with token protection
-            if preserve_terms:
-                preservation_map = self.term_preserver.create_preservation_map(text)
-                processed_text = self.term_preserver.apply_protection_tokens(text, preservation_map)
-                # Log preservation details for debugging
-                if preservation_map:
-                    print(f"Protected {len(preservation_map)} terms with tokens")
-            else:
-                processed_text = text
-                preservation_map = {}
-            
-            # Step 2: Create translation request
-            request = TranslationRequest(
-                text=processed_text,
-                source_language=source_lang,
-                target_language=target_lang,
-                preserve_technical_terms=preserve_terms,
-                context="CVE security document translation"
+            request, preservation_map = self._prepare_translation(
+                text, source_lang, target_lang, preserve_terms
             )
             
-            # Step 3: Perform translation
-            translation_response = self.translator.translate(request)
-            
-            # Step 4: Restore preserved terms
-            if preserve_terms:
-                final_translation = self.term_preserver.restore_preservation_map(
-                    translation_response.translated_text, 
-                    preservation_map
-                )
-            else:
-                final_translation = translation_response.translated_text
-            
-            # Step 5: Validate translation if requested
-            validation_result = None
-            if validate:
-                try:
-                    validation_result = self.validator.validate(text, final_translation)
-                    # Ensure validation result has proper structure
-                    if validation_result and hasattr(validation_result, 'to_dict'):
-                        validation_dict = validation_result.to_dict()
-                    elif isinstance(validation_result, dict):
-                        validation_dict = validation_result
-                    else:
-                        validation_dict = {
-                            'similarity_score': getattr(validation_result, 'similarity_score', 0.0),
-                            'confidence_score': getattr(validation_result, 'confidence_score', 0.0),
-                            'quality': getattr(validation_result, 'quality', 'unknown')
-                        }
-                except Exception as e:
-                    print(f"Validation failed: {e}")
-                    # Create a basic validation result with similarity calculation
-                    try:
-                        similarity = self.validator.calculate_similarity(text, final_translation)
-                        validation_dict = {
-                            'similarity_score': similarity,
-                            'confidence_score': 0.8,  # Default confidence
-                            'quality': 'good' if similarity > 0.7 else 'moderate'
-                        }
-                    except:
-                        validation_dict = {
-                            'similarity_score': 0.75,  # Default similarity
-                            'confidence_score': 0.8,
-                            'quality': 'good'
-                        }
-            else:
-                validation_dict = None
+            # Step 3: Perform translation (unless an identical request is cached)
+            translation_response = self._get_cached_response(request)
+            if translation_response is None:
+                if on_delta:
+                    translation_response = self.translator.translate(request, on_delta=on_delta)
+                else:
+                    translation_response = self.translator.translate(request)
+                self._store_cached_response(request, translation_response)
             
-            # Step 6: Verify term preservation
-            terms_preserved = self.term_preserver.verify_preservation(text, final_translation)
+            return self._finalize_translation(
+                text, translation_response, preservation_map, validate, preserve_terms, start_time
+            )
             
-            processing_time = time.time() - start_time
+        except Exception as e:
+            return self._failed_translation(text, e, start_time)
+
+    async def translate_text_async(
+        self, 
+        text: str, 
+        source_lang: LanguageCode = LanguageCode.ENGLISH,
+        target_lang: LanguageCode = LanguageCode.JAPANESE,
+        validate: bool = True,
+        preserve_terms: bool = True
+    ) -> Dict[str, Any]:
+        """Translate a single text with full workflow without blocking the event loop"""
+        
+        start_time = time.time()
+        
+        try:
+            request, preservation_map = self._prepare_translation(
+                text, source_lang, target_lang, preserve_terms
+            )
             
-            # Update statistics
-            self._update_stats(processing_time, True)
+            # Step 3: Perform translation (unless an identical request is cached)
+            translation_response = self._get_cached_response(request)
+            if translation_response is None:
+                translation_response = await self.translator.translate_async(request)
+                self._store_cached_response(request, translation_response)
             
-            return {
-                'success': True,
-                'original_text': text,
-                'translated_text': final_translation,
-                'translation_response': translation_response,
-                'validation_result': validation_dict,
-                'terms_preserved': terms_preserved,
-                'processing_time': processing_time,
-                'preservation_stats': self.term_preserver.get_preservation_statistics(text, final_translation)
-            }
+            # Validation calls the embeddings API synchronously, keep it off the loop
+            return await asyncio.to_thread(
+                self._finalize_translation,
+                text, translation_response, preservation_map, validate, preserve_terms, start_time
+            )
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            self._update_stats(processing_time, False)
-            
+            return self._failed_translation(text, e, start_time)
+
+    def _prepare_translation(
+        self,
+        text: str,
+        source_lang: LanguageCode,
+        target_lang: LanguageCode,
+        preserve_terms: bool
+    ) -> Tuple[TranslationRequest, Dict[str, str]]:
+        """Protect technical terms and build the translation request"""
+        # Update total translations counter
+        self.stats['total_translations'] += 1
+        # Step 1: Prepare text and preserve technical terms with token protection
+        if preserve_terms:
+            preservation_map = self.term_preserver.create_preservation_map(text)
+            processed_text = self.term_preserver.apply_protection_tokens(text, preservation_map)
+            # Log preservation details for debugging
+            if preservation_map:
+                print(f"Protected {len(preservation_map)} terms with tokens")
+        else:
+            processed_text = text
+            preservation_map = {}
+        
+        # Step 2: Create translation request
+        request = TranslationRequest(
+            text=processed_text,
+            source_language=source_lang,
+            target_language=target_lang,
+            preserve_technical_terms=preserve_terms,
+            context="CVE security document translation"
+        )
+        
+        return request, preservation_map
+
+    def _finalize_translation(
+        self,
+        text: str,
+        translation_response: TranslationResponse,
+        preservation_map: Dict[str, str],
+        validate: bool,
+        preserve_terms: bool,
+        start_time: float
+    ) -> Dict[str, Any]:
+        """Restore preserved terms, validate, and build the result payload"""
+        # Step 4: Restore preserved terms
+        if preserve_terms:
+            final_translation = self.term_preserver.restore_preservation_map(
+                translation_response.translated_text, 
+                preservation_map
+            )
+        else:
+            final_translation = translation_response.translated_text
+        
+        # Step 5: Validate translation if requested
+        validation_dict = self._validate_translation(text, final_translation) if validate else None
+        
+        # Step 6: Verify term preservation; the statistics scan both texts once and
+        # their missing-term count is exactly what verify_preservation checks
+        preservation_stats = self.term_preserver.get_preservation_statistics(text, final_translation)
+        terms_preserved = preservation_stats['missing_terms'] == 0
+        
+        processing_time = time.time() - start_time
+        
+        # Update statistics
+        self._update_stats(processing_time, True)
+        
+        return {
+            'success': True,
+            'original_text': text,
+            'translated_text': final_translation,
+            'translation_response': translation_response,
+            'validation_result': validation_dict,
+            'terms_preserved': terms_preserved,
+            'processing_time': processing_time,
+            'preservation_stats': preservation_stats
+        }
+
+    def _validate_translation(self, text: str, final_translation: str) -> Dict[str, Any]:
+        """Validate a single translation, falling back to default scores on failure"""
+        trivial = self._trivial_validation(text, final_translation)
+        if trivial is not None:
+            return trivial
+        
+        try:
+            return self._validation_to_dict(
+                self.validator.validate(text, final_translation, quality_threshold=self.config.quality_threshold)
+            )
+        except Exception as e:
+            print(f"Validation failed: {e}")
+            # Create a basic validation result with similarity calculation
+            try:
+                similarity = self.validator.calculate_similarity(text, final_translation)
+                return {
+                    'similarity_score': similarity,
+                    'confidence_score': 0.8,  # Default confidence
+                    'quality': 'good' if similarity > 0.7 else 'moderate'
+                }
+            except:
+                return {
+                    'similarity_score': 0.75,  # Default similarity
+                    'confidence_score': 0.8,
+                    'quality': 'good'
+                }
+
+    def _validation_to_dict(self, validation_result) -> Dict[str, Any]:
+        """Ensure validation result has proper structure"""
+        if validation_result and hasattr(validation_result, 'to_dict'):
+            return validation_result.to_dict()
+        elif isinstance(validation_result, dict):
+            return validation_result
+        else:
             return {
-                'success': False,
-                'error': str(e),
-                'error_type': type(e).__name__,
-                'processing_time': processing_time,
-                'original_text': text
+                'similarity_score': getattr(validation_result, 'similarity_score', 0.0),
+                'confidence_score': getattr(validation_result, 'confidence_score', 0.0),
+                'quality': getattr(validation_result, 'quality', 'unknown')
             }
 
+    def _validate_results(self, results: List[Dict[str, Any]]):
+        """Validate successful translations together, batching embedding requests"""
+        successful = [result for result in results if result and result['success']]
+        if not successful:
+            return
+        
+        # Trivial translations are scored locally; only the rest need embeddings
+        needs_embedding = []
+        for result in successful:
+            validation = self._trivial_validation(result['original_text'], result['translated_text'])
+            if validation is None:
+                needs_embedding.append(result)
+            else:
+                result['validation_result'] = validation
+        
+        if not needs_embedding:
+            return
+        
+        pairs = [(result['original_text'], result['translated_text']) for result in needs_embedding]
+        
+        if hasattr(self.validator, 'batch_validate'):
+            try:
+                validations = [
+                    self._validation_to_dict(validation)
+                    for validation in self.validator.batch_validate(
+                        pairs, quality_threshold=self.config.quality_threshold
+                    )
+                ]
+            except Exception as e:
+                print(f"Batch validation failed: {e}")
+                validations = [self._validate_translation(*pair) for pair in pairs]
+        else:
+            validations = [self._validate_translation(*pair) for pair in pairs]
+        
+        for result, validation in zip(needs_embedding, validations):
+            result['validation_result'] = validation
+
+    def _trivial_validation(self, original: str, translated: str) -> Optional[Dict[str, Any]]:
+        """Score translations that do not need an embedding comparison, or return None"""
+        original = original.strip()
+        translated = translated.strip()
+        if not original or not translated:
+            return None
+        
+        # Identifier-only blocks (CVE IDs, versions, scores) are expected to pass through unchanged
+        if translated == original:
+            remainder = self.term_preserver.strip_terms(original)
+            if not WORD_PATTERN.search(remainder):
+                return {'similarity_score': 1.0, 'confidence_score': 1.0, 'quality': 'excellent'}
+            # Identical embeddings would score prose that was left untranslated as perfect
+            return {'similarity_score': 1.0, 'confidence_score': 0.5, 'quality': 'needs_review'}
+        
+        # Short labels embed poorly anyway; plausible length and intact terms are enough
+        if len(original) <= self.config.trivial_validation_max_chars:
+            length_ratio = len(translated) / len(original)
+            if 0.3 <= length_ratio <= 3.0 and self.term_preserver.verify_preservation(original, translated):
+                return {'similarity_score': 0.9, 'confidence_score': 0.9, 'quality': 'excellent'}
+        
+        return None
+
+    def _failed_translation(self, text: str, error: Exception, start_time: float) -> Dict[str, Any]:
+        """Record a failed translation and build the error payload"""
+        processing_time = time.time() - start_time
+        self._update_stats(processing_time, False)
+        
+        return {
+            'success': False,
+            'error': str(error),
+            'error_type': type(error).__name__,
+            'processing_time': processing_time,
+            'original_text': text
+        }
+
     def translate_batch(
         self, 
         texts: List[str], 
@@ -170,42 +371,253 @@ class TranslationOrchestrator:
         if not texts:
             return []
         
-        results = []
+        return self.translator.run_async(
+            self.translate_batch_async(
+                texts, source_lang, target_lang, validate, preserve_terms,
+                max_concurrency=max_workers
+            )
+        )
+
+    async def translate_batch_async(
+        self, 
+        texts: List[str], 
+        source_lang: LanguageCode = LanguageCode.ENGLISH,
+        target_lang: LanguageCode = LanguageCode.JAPANESE,
+        validate: bool = True,
+        preserve_terms: bool = True,
+        max_concurrency: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        scheduler: Optional[BatchScheduler] = None
+    ) -> List[Dict[str, Any]]:
+        """Translate multiple texts concurrently, returning results in input order
+        
+        Texts are packed into micro-batches that share one translation request,
+        and the micro-batches are dispatched concurrently. Batches of one job pass
+        the same scheduler to share its request limits and deduplication.
+        """
+        
+        if not texts:
+            return []
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        completed = 0
+        
+        def report(count: int):
+            nonlocal completed
+            completed += count
+            if progress_callback:
+                progress_callback(completed, len(texts))
+        
+        # Step 1: Protect terms and build requests for every text up front
+        prepared = []
+        for index, text in enumerate(texts):
+            start_time = time.time()
+            try:
+                request, preservation_map = self._prepare_translation(
+                    text, source_lang, target_lang, preserve_terms
+                )
+                prepared.append((index, text, request, preservation_map, start_time))
+            except Exception as e:
+                results[index] = self._failed_translation(text, e, start_time)
+                report(1)
+        
+        # Step 2: Serve cache hits without calling the translator
+        cached = []
+        uncached = []
+        for item in prepared:
+            response = self._get_cached_response(item[2])
+            if response is None:
+                uncached.append(item)
+            else:
+                cached.append((item, response))
+        
+        if scheduler is None:
+            scheduler = BatchScheduler(self.config.length_buckets, max_concurrency)
         
-        # Process in batches to respect rate limits
-        batch_size = min(self.config.batch_size, len(texts))
+        # Identical blocks (table headers, boilerplate) are translated once and fanned
+        # out, including blocks another batch of this job is already translating
+        unique = {}
+        followers: Dict[int, List[tuple]] = {}
+        borrowed = []
+        for item in uncached:
+            in_flight = scheduler.in_flight.get(item[2].text)
+            if in_flight is not None:
+                borrowed.append((item, in_flight))
+                continue
+            first = unique.setdefault(item[2].text, item)
+            if first is not item:
+                followers.setdefault(first[0], []).append(item)
+        uncached = list(unique.values())
+        for item in uncached:
+            scheduler.claim(item[2].text)
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit batch of translation tasks
-            future_to_text = {}
+        # Validation is deferred so all blocks share batched embedding requests
+        async def finalize(item, response):
+            index, text, _, preservation_map, start_time = item
+            try:
+                result = self._finalize_translation(
+                    text, response, preservation_map, False, preserve_terms, start_time
+                )
+            except Exception as e:
+                result = self._failed_translation(text, e, start_time)
+            return index, result
+        
+        async def finalize_cached():
+            cached_results = await asyncio.gather(
+                *(finalize(item, response) for item, response in cached)
+            )
+            report(len(cached_results))
+            return cached_results
+        
+        async def follow(item, in_flight):
+            try:
+                # Shielded so cancelling this batch leaves the other batch's request alone
+                response = await asyncio.shield(in_flight)
+            except Exception as e:
+                index, text, _, _, start_time = item
+                result = (index, self._failed_translation(text, e, start_time))
+            else:
+                result = await finalize(item, response)
+            report(1)
+            return [result]
+        
+        async def run(group, tokens):
+            bucket_index = scheduler.bucket_for(tokens)
+            streamed = 0
             
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                
-                for text in batch:
-                    future = executor.submit(
-                        self.translate_text,
-                        text, source_lang, target_lang, validate, preserve_terms
-                    )
-                    future_to_text[future] = text
+            # Segments are reported as they stream in; the rest once the group settles
+            def on_segments(done: int):
+                nonlocal streamed
+                if done > streamed:
+                    report(done - streamed)
+                    streamed = done
             
-            # Collect results as they complete
-            for future in as_completed(future_to_text, timeout=self.config.timeout_seconds):
+            async with scheduler.semaphores[bucket_index]:
                 try:
-                    result = future.result()
-                    results.append(result)
+                    responses = await asyncio.wait_for(
+                        self.translator.translate_many_async(
+                            [item[2] for item in group], progress_callback=on_segments
+                        ),
+                        timeout=scheduler.buckets[bucket_index][2]
+                    )
                 except Exception as e:
-                    # Handle individual translation failures
-                    text = future_to_text[future]
-                    results.append({
-                        'success': False,
-                        'error': str(e),
-                        'error_type': type(e).__name__,
-                        'original_text': text
-                    })
+                    for item in group:
+                        scheduler.settle(item[2].text, error=e)
+                    # The whole micro-batch failed, report each text individually
+                    failed = [
+                        item for first in group for item in [first, *followers.get(first[0], [])]
+                    ]
+                    report(len(failed) - streamed)
+                    return [
+                        (index, self._failed_translation(text, e, start_time))
+                        for index, text, _, _, start_time in failed
+                    ]
+            
+            pending = []
+            for item, response in zip(group, responses):
+                self._store_cached_response(item[2], response)
+                scheduler.settle(item[2].text, response)
+                pending.append((item, response))
+                pending.extend((follower, response) for follower in followers.get(item[0], []))
+            
+            group_results = await asyncio.gather(
+                *(finalize(item, response) for item, response in pending)
+            )
+            report(len(pending) - streamed)
+            return group_results
+        
+        tasks = [run(group, tokens) for group, tokens in self._pack_requests(uncached)]
+        tasks.extend(follow(item, in_flight) for item, in_flight in borrowed)
+        if cached:
+            tasks.append(finalize_cached())
+        
+        for next_done in asyncio.as_completed(tasks):
+            for index, result in await next_done:
+                results[index] = result
+        
+        # Step 3: Validate every successful translation together
+        if validate:
+            # Embedding calls are synchronous, keep them off the loop
+            await asyncio.to_thread(self._validate_results, results)
         
         return results
 
+    def _cache_key(self, request: TranslationRequest) -> str:
+        """Translation cache key covering everything sent to the model besides the text"""
+        return self.translation_cache.make_key(
+            request.text,
+            self.config.model_name,
+            request.target_language.value,
+            system_prompt=getattr(self.translator, 'system_prompt', ''),
+            context=request.context or '',
+            temperature=self.config.temperature
+        )
+
+    def _get_cached_response(self, request: TranslationRequest) -> Optional[TranslationResponse]:
+        """Return a cached translator response for an identical request, if any"""
+        if not self.translation_cache:
+            return None
+        
+        key = self._cache_key(request)
+        translated_text = self.translation_cache.get(key)
+        if translated_text is None:
+            return None
+        
+        return TranslationResponse(
+            translated_text=translated_text,
+            original_text=request.text,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            confidence_score=0.95,
+            metadata={'model': self.config.model_name, 'cached': True}
+        )
+
+    def _store_cached_response(self, request: TranslationRequest, response: TranslationResponse):
+        """Cache a complete translator response"""
+        if not self.translation_cache or response.metadata.get('cached'):
+            return
+        # Truncated or looping output should be retried rather than replayed
+        if response.metadata.get('finish_reason') in ('length', 'repetition'):
+            return
+        
+        key = self._cache_key(request)
+        self.translation_cache.set(key, response.translated_text)
+
+    def _pack_requests(self, prepared: List[tuple]) -> List[Tuple[List[tuple], int]]:
+        """Greedily pack prepared requests into micro-batches under the token budget
+        
+        Returns each micro-batch together with its prompt token count.
+        """
+        texts = [item[2].text for item in prepared]
+        count_tokens_batch = getattr(self.translator, 'count_tokens_batch', None)
+        count_tokens = getattr(self.translator, 'count_tokens', None)
+        if count_tokens_batch:
+            token_counts = count_tokens_batch(texts)
+        elif count_tokens:
+            token_counts = [count_tokens(text) for text in texts]
+        else:
+            token_counts = [max(1, len(text) // 4) for text in texts]
+        
+        # Leave room for the translated output, which is usually longer than the input
+        token_budget = self.config.max_tokens // 2
+        max_blocks = max(1, self.config.max_blocks_per_request)
+        
+        groups = []
+        current = []
+        current_tokens = 0
+        for item, tokens in zip(prepared, token_counts):
+            if current and (current_tokens + tokens > token_budget or len(current) >= max_blocks):
+                groups.append((current, current_tokens))
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += tokens
+        
+        if current:
+            groups.append((current, current_tokens))
+        
+        return groups
+
     def _update_stats(self, processing_time: float, success: bool):
         """Update processing statistics"""
         if success:
@@ -222,6 +634,331 @@ class TranslationOrchestrator:
                 self.stats['total_processing_time'] / total_requests
             )
 
+    def submit_document_batch(
+        self,
+        file_content: bytes,
+        file_extension: str,
+        document_processor: IDocumentProcessor,
+        source_lang: LanguageCode = LanguageCode.ENGLISH,
+        target_lang: LanguageCode = LanguageCode.JAPANESE
+    ) -> Dict[str, Any]:
+        """Queue a document's translatable blocks on the translator's Batch API
+        
+        Batch jobs finish within 24 hours at a reduced price; collect the result
+        with complete_document_batch using the same document bytes.
+        """
+        try:
+            if not hasattr(self.translator, 'submit_batch'):
+                raise ProcessingError(
+                    "Translator does not support batch jobs",
+                    error_code="BATCH_UNSUPPORTED"
+                )
+            if not document_processor.can_process(file_extension):
+                raise ProcessingError(
+                    f"Processor cannot handle {file_extension} files",
+                    error_code="UNSUPPORTED_FORMAT"
+                )
+            
+            requests, _, _, _ = self._prepare_document_batch(
+                file_content, document_processor, source_lang, target_lang
+            )
+            if not requests:
+                raise ProcessingError("Document has no translatable content", error_code="NOTHING_TO_TRANSLATE")
+            
+            # Repeated blocks are queued once; complete_document_batch fans them back out
+            unique_requests, _ = self._dedupe_requests(requests)
+            
+            return {
+                'success': True,
+                'batch_id': self.translator.submit_batch(unique_requests),
+                'block_count': len(requests)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_type': type(e).__name__
+            }
+
+    def complete_document_batch(
+        self,
+        batch_id: str,
+        file_content: bytes,
+        document_processor: IDocumentProcessor,
+        source_lang: LanguageCode = LanguageCode.ENGLISH,
+        target_lang: LanguageCode = LanguageCode.JAPANESE,
+        validate: bool = True
+    ) -> Optional[ProcessingResult]:
+        """Build the translated document for a finished batch job, or return None while it is still running"""
+        start_time = time.time()
+        
+        try:
+            requests, preservation_maps, extraction_result, batch = self._prepare_document_batch(
+                file_content, document_processor, source_lang, target_lang
+            )
+            
+            unique_requests, slots = self._dedupe_requests(requests)
+            responses = self.translator.collect_batch(batch_id, unique_requests)
+            if responses is None:
+                return None
+            
+            translation_results = []
+            for index, request in enumerate(requests):
+                response = responses.get(slots[index])
+                text = request.text
+                if response is None:
+                    translation_results.append(self._failed_translation(
+                        text, TranslationServiceError("No batch result for block"), start_time
+                    ))
+                    continue
+                translation_results.append(self._finalize_translation(
+                    text, response, preservation_maps[index], False, True, start_time
+                ))
+            
+            return self._assemble_document(
+                document_processor,
+                extraction_result,
+                batch,
+                translation_results,
+                validate,
+                start_time
+            )
+            
+        except Exception as e:
+            return ProcessingResult(
+                success=False,
+                error_message=f"Batch document translation failed: {str(e)}",
+                processing_stats={
+                    'processing_time': time.time() - start_time,
+                    'error_type': type(e).__name__
+                }
+            )
+
+    def _prepare_document_batch(
+        self,
+        file_content: bytes,
+        document_processor: IDocumentProcessor,
+        source_lang: LanguageCode,
+        target_lang: LanguageCode
+    ) -> Tuple[List[TranslationRequest], List[Dict[str, str]], Dict[str, Any], ContentBatch]:
+        """Extract a document and build one protected request per translatable block"""
+        extraction_result = document_processor.extract_content(file_content)
+        document_content = extraction_result.get('document_content')
+        if not document_content:
+            raise ProcessingError("Failed to extract document content")
+        
+        batch = ContentBatch.from_blocks(document_content.content_blocks)
+        requests = []
+        preservation_maps = []
+        for block_index in batch.translatable_indices():
+            request, preservation_map = self._prepare_translation(
+                batch.texts[block_index], source_lang, target_lang, True
+            )
+            requests.append(request)
+            preservation_maps.append(preservation_map)
+        
+        return requests, preservation_maps, extraction_result, batch
+
+    def _dedupe_requests(
+        self, requests: List[TranslationRequest]
+    ) -> Tuple[List[TranslationRequest], List[int]]:
+        """Collapse requests with identical text, returning the unique requests and each request's slot among them"""
+        unique_requests = []
+        slot_by_text: Dict[str, int] = {}
+        slots = []
+        for request in requests:
+            slot = slot_by_text.get(request.text)
+            if slot is None:
+                slot = slot_by_text[request.text] = len(unique_requests)
+                unique_requests.append(request)
+            slots.append(slot)
+        return unique_requests, slots
+
+    async def _extract_and_translate(
+        self,
+        file_content: bytes,
+        document_processor: IDocumentProcessor,
+        source_lang: LanguageCode,
+        target_lang: LanguageCode,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[Dict[str, Any], Optional[ContentBatch], List[Dict[str, Any]]]:
+        """Parse a document on a worker thread and start translating its first blocks before parsing ends
+        
+        Returns the extraction result, the columnar content batch and one translation
+        result per translatable block, in document order. Validation is left to the
+        caller so it can overlap with reconstruction.
+        """
+        loop = asyncio.get_running_loop()
+        # Both waves draw on one set of request limits and share in-flight blocks
+        scheduler = BatchScheduler(self.config.length_buckets)
+        wave_size = self.config.batch_size * self.config.max_blocks_per_request
+        first_wave: List[str] = []
+        wave_ready = asyncio.Event()
+        
+        def on_block(block: Dict[str, Any]):
+            # Called from the extraction thread
+            if block.get('translatable', False) and len(first_wave) < wave_size:
+                first_wave.append(block['text'])
+                if len(first_wave) == wave_size:
+                    loop.call_soon_threadsafe(wave_ready.set)
+        
+        # Progress is only forwarded once parsing has fixed the total block count
+        completed = {'first': 0, 'rest': 0}
+        total = None
+        
+        def report():
+            if progress_callback and total:
+                progress_callback(sum(completed.values()), total)
+        
+        def track(part: str) -> Callable[[int, int], None]:
+            def update(done: int, _: int):
+                completed[part] = done
+                report()
+            return update
+        
+        extraction = asyncio.create_task(
+            asyncio.to_thread(document_processor.extract_content, file_content, on_block=on_block)
+        )
+        wave_wait = asyncio.create_task(wave_ready.wait())
+        await asyncio.wait({extraction, wave_wait}, return_when=asyncio.FIRST_COMPLETED)
+        wave_wait.cancel()
+        
+        first_task = None
+        if wave_ready.is_set():
+            first_task = asyncio.create_task(
+                self.translate_batch_async(
+                    list(first_wave), source_lang, target_lang, False,
+                    preserve_terms=True, progress_callback=track('first'), scheduler=scheduler
+                )
+            )
+        
+        try:
+            extraction_result = await extraction
+        except BaseException:
+            if first_task:
+                first_task.cancel()
+            raise
+        
+        document_content = extraction_result.get('document_content')
+        batch = ContentBatch.from_blocks(document_content.content_blocks) if document_content else None
+        texts = [batch.texts[i] for i in batch.translatable_indices()] if batch else []
+        if not texts:
+            if first_task:
+                first_task.cancel()
+            return extraction_result, batch, []
+        
+        head = len(first_wave) if first_task else 0
+        total = len(texts)
+        report()
+        
+        rest_results = []
+        if texts[head:]:
+            rest_results = await self.translate_batch_async(
+                texts[head:], source_lang, target_lang, False,
+                preserve_terms=True, progress_callback=track('rest'), scheduler=scheduler
+            )
+        first_results = await first_task if first_task else []
+        
+        return extraction_result, batch, first_results + rest_results
+
+    async def _reconstruct_and_validate(
+        self,
+        document_processor: IDocumentProcessor,
+        extraction_result: Dict[str, Any],
+        translation_map: Dict[str, str],
+        translation_results: List[Dict[str, Any]],
+        validate: bool
+    ) -> bytes:
+        """Rebuild the document on a worker thread while validation runs on another"""
+        reconstruction = asyncio.to_thread(
+            document_processor.reconstruct_document, extraction_result, translation_map
+        )
+        if not validate:
+            return await reconstruction
+        
+        translated_document, _ = await asyncio.gather(
+            reconstruction,
+            asyncio.to_thread(self._validate_results, translation_results)
+        )
+        return translated_document
+
+    def _assemble_document(
+        self,
+        document_processor: IDocumentProcessor,
+        extraction_result: Dict[str, Any],
+        batch: ContentBatch,
+        translation_results: List[Dict[str, Any]],
+        validate: bool,
+        start_time: float
+    ) -> ProcessingResult:
+        """Rebuild a document from per-block translation results and summarize the run"""
+        document_content = extraction_result['document_content']
+        translatable_indices = batch.translatable_indices()
+        
+        # Pair translated blocks with their ids
+        translation_map = {}
+        for block_index, result in zip(translatable_indices, translation_results):
+            if result['success']:
+                translation_map[batch.ids[block_index]] = result['translated_text']
+            else:
+                # Keep original text if translation fails
+                translation_map[batch.ids[block_index]] = batch.texts[block_index]
+        
+        # Reconstruct document while the translations are validated
+        translated_document = asyncio.run(
+            self._reconstruct_and_validate(
+                document_processor,
+                extraction_result,
+                translation_map,
+                translation_results,
+                validate
+            )
+        )
+        
+        # Collect validations
+        validation_results = []
+        for result in translation_results:
+            if result['success'] and result.get('validation_result'):
+                validation_result = result['validation_result']
+                # Convert dict to ValidationResult if needed
+                if isinstance(validation_result, dict):
+                    try:
+                        quality_map = {
+                            'excellent': TranslationQuality.EXCELLENT,
+                            'good': TranslationQuality.GOOD,
+                            'needs_review': TranslationQuality.NEEDS_REVIEW,
+                            'poor': TranslationQuality.POOR
+                        }
+                        quality = quality_map.get(validation_result.get('quality', 'good'), TranslationQuality.GOOD)
+                        validation_obj = ValidationResult(
+                            similarity_score=validation_result.get('similarity_score', 0.0),
+                            quality=quality,
+                            technical_terms_preserved=True,
+                            confidence_score=validation_result.get('confidence_score', 0.0)
+                        )
+                        validation_results.append(validation_obj)
+                    except Exception as e:
+                        print(f"Failed to convert validation result: {e}")
+                else:
+                    validation_results.append(validation_result)
+        
+        processing_time = time.time() - start_time
+        
+        return ProcessingResult(
+            success=True,
+            document_content=document_content,
+            translated_document=translated_document,
+            validation_results=validation_results,
+            processing_stats={
+                'total_blocks': len(document_content.content_blocks),
+                'translatable_blocks': len(translatable_indices),
+                'successful_translations': len([r for r in translation_results if r['success']]),
+                'failed_translations': len([r for r in translation_results if not r['success']]),
+                'processing_time': processing_time,
+                'average_validation_score': self._calculate_average_validation_score(validation_results)
+            }
+        )
+
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Get current processing statistics"""
         return {
@@ -257,7 +994,8 @@ class TranslationOrchestrator:
         document_processor: IDocumentProcessor,
         source_lang: LanguageCode = LanguageCode.ENGLISH,
         target_lang: LanguageCode = LanguageCode.JAPANESE,
-        validate: bool = True
+        validate: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> ProcessingResult:
         """Translate an entire document with format preservation"""
         
@@ -271,20 +1009,25 @@ class TranslationOrchestrator:
                     error_code="UNSUPPORTED_FORMAT"
                 )
             
-            # Step 2: Extract document content
-            extraction_result = document_processor.extract_content(file_content)
+            # Step 2: Extract document content, translating the first blocks while parsing continues
+            extraction_result, batch, translation_results = self.translator.run_async(
+                self._extract_and_translate(
+                    file_content,
+                    document_processor,
+                    source_lang,
+                    target_lang,
+                    progress_callback
+                )
+            )
             document_content = extraction_result.get('document_content')
             
             if not document_content:
                 raise ProcessingError("Failed to extract document content")
             
             # Step 3: Identify translatable content
-            translatable_blocks = [
-                block for block in document_content.content_blocks 
-                if block.get('translatable', False)
-            ]
+            translatable_indices = batch.translatable_indices()
             
-            if not translatable_blocks:
+            if not len(translatable_indices):
                 return ProcessingResult(
                     success=True,
                     document_content=document_content,
@@ -296,79 +1039,13 @@ class TranslationOrchestrator:
                     }
                 )
             
-            # Step 4: Translate content blocks
-            translation_map = {}
-            validation_results = []
-            
-            # Process blocks in batches
-            texts_to_translate = [block['text'] for block in translatable_blocks]
-            block_ids = [block['id'] for block in translatable_blocks]
-            
-            translation_results = self.translate_batch(
-                texts_to_translate, 
-                source_lang, 
-                target_lang, 
-                validate, 
-                preserve_terms=True
-            )
-            
-            # Build translation map and collect validations
-            for block_id, result in zip(block_ids, translation_results):
-                if result['success']:
-                    translation_map[block_id] = result['translated_text']
-                    if result.get('validation_result'):
-                        validation_result = result['validation_result']
-                        # Convert dict to ValidationResult if needed
-                        if isinstance(validation_result, dict):
-                            from core.models import ValidationResult, TranslationQuality
-                            try:
-                                quality_map = {
-                                    'excellent': TranslationQuality.EXCELLENT,
-                                    'good': TranslationQuality.GOOD,
-                                    'needs_review': TranslationQuality.NEEDS_REVIEW,
-                                    'poor': TranslationQuality.POOR
-                                }
-                                quality = quality_map.get(validation_result.get('quality', 'good'), TranslationQuality.GOOD)
-                                validation_obj = ValidationResult(
-                                    similarity_score=validation_result.get('similarity_score', 0.0),
-                                    quality=quality,
-                                    technical_terms_preserved=True,
-                                    confidence_score=validation_result.get('confidence_score', 0.0)
-                                )
-                                validation_results.append(validation_obj)
-                            except Exception as e:
-                                print(f"Failed to convert validation result: {e}")
-                        else:
-                            validation_results.append(validation_result)
-                else:
-                    # Keep original text if translation fails
-                    original_text = next(
-                        (block['text'] for block in translatable_blocks if block['id'] == block_id),
-                        ""
-                    )
-                    translation_map[block_id] = original_text
-            
-            # Step 5: Reconstruct document with translations
-            translated_document = document_processor.reconstruct_document(
-                extraction_result, 
-                translation_map
-            )
-            
-            processing_time = time.time() - start_time
-            
-            return ProcessingResult(
-                success=True,
-                document_content=document_content,
-                translated_document=translated_document,
-                validation_results=validation_results,
-                processing_stats={
-                    'total_blocks': len(document_content.content_blocks),
-                    'translatable_blocks': len(translatable_blocks),
-                    'successful_translations': len([r for r in translation_results if r['success']]),
-                    'failed_translations': len([r for r in translation_results if not r['success']]),
-                    'processing_time': processing_time,
-                    'average_validation_score': self._calculate_average_validation_score(validation_results)
-                }
+            return self._assemble_document(
+                document_processor,
+                extraction_result,
+                batch,
+                translation_results,
+                validate,
+                start_time
             )
             
         except Exception as e:
@@ -3,18 +3,47 @@ DOCX Document Processor
 Implements IDocumentProcessor interface for DOCX files using python-docx
 """
 
+import os
 import tempfile
 import io
-from typing import Dict, Any, List
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Dict, Any, List, Optional, Callable
 from docx import Document
 from docx.shared import Inches
-from docx.enum.text import WD_COLOR_INDEX
+from docx.enum.text import WD_COLOR_INDEX, WD_BREAK
+from docx.oxml import parse_xml
+from docx.text.paragraph import Paragraph
 
 from core.interfaces import IDocumentProcessor
 from core.models import DocumentContent, DocumentType
 from core.exceptions import ProcessingError, UnsupportedFormatError
 
 
+# Paragraphs matching any of these are technical content and left untranslated;
+# the alternatives share one compiled pattern so each paragraph is scanned once
+TECHNICAL_TEXT_PATTERN = re.compile('|'.join([
+    r'^CVE-\d{4}-\d{4,7}$',
+    r'^https?://',
+    r'^\d+\.\d+[\.\d+]*$',
+    r'^[A-Z_][A-Z0-9_]*$',  # Constants
+    r'^\w+@\w+\.\w+$'  # Emails
+]), re.IGNORECASE)
+
+# WordprocessingML tags compared exactly while streaming word/document.xml
+W_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_BODY = W_NAMESPACE + 'body'
+W_PARAGRAPH = W_NAMESPACE + 'p'
+W_PARAGRAPH_PROPERTIES = W_NAMESPACE + 'pPr'
+W_SECTION_PROPERTIES = W_NAMESPACE + 'sectPr'
+W_TABLE = W_NAMESPACE + 'tbl'
+W_TABLE_CELL = W_NAMESPACE + 'tc'
+W_TEXT = W_NAMESPACE + 't'
+W_TAB = W_NAMESPACE + 'tab'
+W_BREAKS = {W_NAMESPACE + 'br', W_NAMESPACE + 'cr'}
+
+
 class DOCXProcessor(IDocumentProcessor):
     """DOCX document processor with full format preservation"""
     
@@ -29,35 +58,37 @@ class DOCXProcessor(IDocumentProcessor):
         """Check if processor can handle DOCX files"""
         return file_extension.lower() in self.supported_extensions
 
-    def extract_content(self, file_content: bytes) -> Dict[str, Any]:
+    def extract_content(
+        self,
+        file_content: bytes,
+        on_block: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
         """Extract translatable content from DOCX while preserving structure"""
         try:
-            # Load document from bytes
-            doc = Document(io.BytesIO(file_content))
-            
-            # CRITICAL FIX: Remove first page content BEFORE processing for translation
-            self._remove_first_page_content_early(doc)
-            
-            # Also remove any remaining first page content that might be in tables or other structures
-            self._clean_remaining_first_page_content(doc)
+            doc = self._load_document(file_content)
             
             content_blocks = []
             tables = []
             hyperlinks = []
             images = []
             
+            def add_block(content_block: Dict[str, Any]):
+                content_blocks.append(content_block)
+                if on_block:
+                    on_block(content_block)
+            
             # Process ALL document paragraphs (including empty ones for structure)
             for para_idx, paragraph in enumerate(doc.paragraphs):
                 content_block = self._process_paragraph(paragraph, para_idx)
                 # Include ALL paragraphs, even empty ones, to maintain structure
                 if content_block is not None:
-                    content_blocks.append(content_block)
+                    add_block(content_block)
             
             # Process text boxes and shapes
             for shape_idx, shape in enumerate(self._get_document_shapes(doc)):
                 shape_content = self._process_shape_text(shape, shape_idx)
-                if shape_content:
-                    content_blocks.extend(shape_content)
+                for content_block in shape_content or []:
+                    add_block(content_block)
             
             # Process tables
             for table_idx, table in enumerate(doc.tables):
@@ -79,7 +110,7 @@ class DOCXProcessor(IDocumentProcessor):
                                     'row_idx': row_idx,
                                     'cell_idx': cell_idx
                                 }
-                                content_blocks.append(content_block)
+                                add_block(content_block)
             
             # Extract hyperlinks
             for paragraph in doc.paragraphs:
@@ -109,6 +140,7 @@ class DOCXProcessor(IDocumentProcessor):
             return {
                 'document_content': document_content,
                 'original_document': doc,
+                'source_document': file_content,
                 'success': True
             }
             
@@ -125,8 +157,13 @@ class DOCXProcessor(IDocumentProcessor):
             if not original_doc:
                 raise ProcessingError("Original document not found in content")
             
-            # Create a copy of the document for modification
-            doc_copy = self._deep_copy_document(original_doc)
+            # Reparse the source for a fresh copy; saving and reloading the original
+            # would re-deflate every part, media included, before the final save
+            source_document = content.get('source_document')
+            if source_document is not None:
+                doc_copy = self._load_document(source_document)
+            else:
+                doc_copy = self._deep_copy_document(original_doc)
             
             # Insert Japanese template image at the beginning
             self._insert_japanese_first_page_image(doc_copy)
@@ -301,10 +338,6 @@ class DOCXProcessor(IDocumentProcessor):
     def _insert_japanese_first_page_image(self, doc):
         """Insert the pre-translated Japanese first page image and remove original first page content"""
         try:
-            from docx.shared import Inches
-            from docx.enum.text import WD_BREAK
-            import os
-            
             # Path to the Japanese template image
             image_path = "japanese_first_page_template.png"
             
@@ -319,14 +352,12 @@ class DOCXProcessor(IDocumentProcessor):
             body = doc._element.body
             
             # Create a new paragraph element for the image
-            from docx.oxml import parse_xml
             new_para_xml = parse_xml('<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"></w:p>')
             
             # Insert at the very beginning of the body
             body.insert(0, new_para_xml)
             
             # Create paragraph object from the XML element
-            from docx.text.paragraph import Paragraph
             image_paragraph = Paragraph(new_para_xml, doc)
             
             # Add the Japanese image to this paragraph
@@ -529,21 +560,23 @@ class DOCXProcessor(IDocumentProcessor):
             return False
         
         # Skip technical patterns
-        import re
-        technical_patterns = [
-            r'^CVE-\d{4}-\d{4,7}$',
-            r'^https?://',
-            r'^\d+\.\d+[\.\d+]*$',
-            r'^[A-Z_][A-Z0-9_]*$',  # Constants
-            r'^\w+@\w+\.\w+$'  # Emails
-        ]
-        
-        for pattern in technical_patterns:
-            if re.match(pattern, text.strip(), re.IGNORECASE):
-                return False
+        stripped = text.strip()
+        if TECHNICAL_TEXT_PATTERN.match(stripped):
+            return False
         
         return True
 
+    def _load_document(self, file_content: bytes):
+        """Load a DOCX with its first page content removed"""
+        doc = Document(io.BytesIO(file_content))
+        
+        # CRITICAL FIX: Remove first page content BEFORE processing for translation
+        self._remove_first_page_content_early(doc)
+        
+        # Also remove any remaining first page content that might be in tables or other structures
+        self._clean_remaining_first_page_content(doc)
+        return doc
+
     def _deep_copy_document(self, original_doc):
         """Create a deep copy of the document for modification"""
         # Save original to buffer and reload
@@ -650,53 +683,79 @@ class DOCXProcessor(IDocumentProcessor):
                 pass
 
     def get_document_statistics(self, file_content: bytes) -> Dict[str, Any]:
-        """Get detailed statistics about the document"""
+        """Get detailed statistics about the document
+        
+        The main document part is streamed with iterparse instead of being loaded
+        as a python-docx Document, so peak memory stays flat for large files.
+        """
         try:
-            doc = Document(io.BytesIO(file_content))
-            
-            stats = {
-                'total_paragraphs': len(doc.paragraphs),
-                'total_tables': len(doc.tables),
-                'total_sections': len(doc.sections),
-                'total_pages': self._estimate_page_count(doc),
-                'word_count': self._count_words(doc),
-                'character_count': self._count_characters(doc)
-            }
+            with zipfile.ZipFile(io.BytesIO(file_content)) as archive:
+                with archive.open('word/document.xml') as document_part:
+                    stats = self._scan_document_part(document_part)
             
+            stats['total_pages'] = max(1, (stats['total_paragraphs'] + stats['total_tables'] * 5) // 30)
             return stats
             
         except Exception as e:
             return {'error': str(e)}
 
-    def _estimate_page_count(self, doc) -> int:
-        """Estimate page count based on content"""
-        # Simple estimation based on paragraph count
-        paragraph_count = len(doc.paragraphs)
-        table_count = len(doc.tables)
-        return max(1, (paragraph_count + table_count * 5) // 30)
-
-    def _count_words(self, doc) -> int:
-        """Count total words in document"""
-        total_words = 0
-        for paragraph in doc.paragraphs:
-            total_words += len(paragraph.text.split())
+    def _scan_document_part(self, document_part) -> Dict[str, Any]:
+        """Count body paragraphs, top-level tables, sections, words and characters in one pass"""
+        paragraphs = tables = sections = words = characters = 0
+        path = []  # tags of the open elements
+        paragraph_texts = []  # one list of text pieces per open paragraph
+        cell_paragraphs = []  # paragraph texts of the open top-level table cell
+        table_depth = 0
         
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    total_words += len(cell.text.split())
+        for event, elem in ET.iterparse(document_part, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                path.append(tag)
+                if tag == W_PARAGRAPH:
+                    paragraph_texts.append([])
+                elif tag == W_TABLE:
+                    if table_depth == 0 and path[-2] == W_BODY:
+                        tables += 1
+                    table_depth += 1
+                continue
+            
+            path.pop()
+            parent = path[-1] if path else None
+            
+            if tag == W_TEXT:
+                if paragraph_texts:
+                    paragraph_texts[-1].append(elem.text or '')
+            elif tag == W_TAB:
+                if paragraph_texts:
+                    paragraph_texts[-1].append('\t')
+            elif tag in W_BREAKS:
+                if paragraph_texts:
+                    paragraph_texts[-1].append('\n')
+            elif tag == W_PARAGRAPH:
+                text = ''.join(paragraph_texts.pop())
+                if parent == W_BODY:
+                    paragraphs += 1
+                    words += len(text.split())
+                    characters += len(text)
+                elif parent == W_TABLE_CELL and table_depth == 1:
+                    cell_paragraphs.append(text)
+            elif tag == W_TABLE_CELL and table_depth == 1:
+                cell_text = '\n'.join(cell_paragraphs)
+                cell_paragraphs.clear()
+                words += len(cell_text.split())
+                characters += len(cell_text)
+            elif tag == W_TABLE:
+                table_depth -= 1
+            elif tag == W_SECTION_PROPERTIES:
+                if parent == W_BODY or path[-3:] == [W_BODY, W_PARAGRAPH, W_PARAGRAPH_PROPERTIES]:
+                    sections += 1
+            
+            elem.clear()
         
-        return total_words
-
-    def _count_characters(self, doc) -> int:
-        """Count total characters in document"""
-        total_chars = 0
-        for paragraph in doc.paragraphs:
-            total_chars += len(paragraph.text)
-        
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    total_chars += len(cell.text)
-        
-        return total_chars
\ No newline at end of file
+        return {
+            'total_paragraphs': paragraphs,
+            'total_tables': tables,
+            'total_sections': sections,
+            'word_count': words,
+            'character_count': characters
+        }
@@ -4,7 +4,7 @@ Implements IDocumentProcessor interface for HTML files using BeautifulSoup
 """
 
 import io
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable, Union
 from bs4 import BeautifulSoup, Tag, NavigableString
 import re
 
@@ -13,6 +13,22 @@ from core.models import DocumentContent, DocumentType
 from core.exceptions import ProcessingError, UnsupportedFormatError
 
 
+# Text matching any of these is technical content and left untranslated;
+# the alternatives share one compiled pattern so each text is scanned once
+TECHNICAL_TEXT_PATTERN = re.compile('|'.join([
+    r'^CVE-\d{4}-\d{4,7}$',
+    r'^https?://',
+    r'^\d+\.\d+[\.\d+]*$',
+    r'^[A-Z_][A-Z0-9_]*$',  # Constants
+    r'^\w+@\w+\.\w+$',  # Emails
+    r'^\d+$',  # Pure numbers
+    r'^[<>=/\-\+\*\(\)\[\]{}]+$'  # Pure symbols
+]), re.IGNORECASE)
+
+LETTER_OR_SPACE_PATTERN = re.compile(r'[a-zA-Z\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
 class HTMLProcessor(IDocumentProcessor):
     """HTML document processor with structure preservation"""
     
@@ -26,11 +42,15 @@ class HTMLProcessor(IDocumentProcessor):
         """Check if processor can handle HTML files"""
         return file_extension.lower() in self.supported_extensions
 
-    def extract_content(self, file_content: bytes) -> Dict[str, Any]:
+    def extract_content(
+        self,
+        file_content: Union[bytes, memoryview, str],
+        on_block: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
         """Extract translatable content from HTML while preserving structure"""
         try:
-            # Parse HTML content
-            html_content = file_content.decode('utf-8')
+            # Pasted HTML is already text; byte buffers are decoded in place without a copy
+            html_content = file_content if isinstance(file_content, str) else str(file_content, 'utf-8')
             soup = BeautifulSoup(html_content, 'html.parser')
             
             content_blocks = []
@@ -51,6 +71,8 @@ class HTMLProcessor(IDocumentProcessor):
                         content_block = self._process_text_element(element, idx, parent)
                         if content_block:
                             content_blocks.append(content_block)
+                            if on_block:
+                                on_block(content_block)
             
             # Process tables
             for table_idx, table in enumerate(soup.find_all('table')):
@@ -189,22 +211,12 @@ class HTMLProcessor(IDocumentProcessor):
             return False
         
         # Skip technical patterns
-        technical_patterns = [
-            r'^CVE-\d{4}-\d{4,7}$',
-            r'^https?://',
-            r'^\d+\.\d+[\.\d+]*$',
-            r'^[A-Z_][A-Z0-9_]*$',  # Constants
-            r'^\w+@\w+\.\w+$',  # Emails
-            r'^\d+$',  # Pure numbers
-            r'^[<>=/\-\+\*\(\)\[\]{}]+$'  # Pure symbols
-        ]
-        
-        for pattern in technical_patterns:
-            if re.match(pattern, text.strip(), re.IGNORECASE):
-                return False
+        stripped = text.strip()
+        if TECHNICAL_TEXT_PATTERN.match(stripped):
+            return False
         
         # Check if text is mostly HTML entities or special characters
-        if len(re.sub(r'[a-zA-Z\s]', '', text)) > len(text) * 0.5:
+        if len(LETTER_OR_SPACE_PATTERN.sub('', text)) > len(text) * 0.5:
             return False
         
         return True
@@ -272,7 +284,7 @@ class HTMLProcessor(IDocumentProcessor):
             text = soup.get_text()
             
             # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = WHITESPACE_PATTERN.sub(' ', text).strip()
             
             # Truncate if necessary
             if len(text) > max_chars:
@@ -5,10 +5,14 @@ Contains implementations for translation, embedding, and other external APIs
 
 from .azure_translator import AzureOpenAITranslator
 from .openai_embeddings import OpenAIEmbeddingProvider
+from .local_embeddings import LocalEmbeddingProvider
 from .cve_term_preserver import CVETermPreserver
+from .translation_cache import TranslationCache
 
 __all__ = [
     'AzureOpenAITranslator',
     'OpenAIEmbeddingProvider', 
-    'CVETermPreserver'
+    'LocalEmbeddingProvider',
+    'CVETermPreserver',
+    'TranslationCache'
 ]
\ No newline at end of file
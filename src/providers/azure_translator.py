@@ -4,9 +4,26 @@ Implements ITranslator interface using Azure OpenAI GPT models
 """
 
 import os
+import copy
+import re
+import json
 import time
-from typing import Dict, Any
-from openai import AzureOpenAI
+import asyncio
+import threading
+import weakref
+from dataclasses import replace
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from openai import AzureOpenAI, AsyncAzureOpenAI
+
+try:
+    import tiktoken
+except ImportError:  # Token counts fall back to a character-based estimate
+    tiktoken = None
+
+try:
+    import orjson
+except ImportError:  # Batch payloads fall back to the standard library codec
+    orjson = None
 
 from core.interfaces import ITranslator
 from core.models import (
@@ -20,6 +37,113 @@ from core.exceptions import (
     AuthenticationError,
     ConfigurationError
 )
+from providers.http_client import get_shared_http_client, create_async_http_client, http_timeout
+
+
+def _json_bytes(value) -> bytes:
+    """Serialize value as compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Parses str or bytes; orjson's decode error subclasses ValueError like json's
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Start of one {"i": ..., "t": ...} item in a streamed JSON batch response
+BATCH_ITEM_PATTERN = re.compile(r'\{\s*"i"\s*:')
+
+# An item start cut off at the end of a streamed delta, carried over to the next scan
+BATCH_ITEM_PREFIX_PATTERN = re.compile(r'\{\s*(?:"(?:i(?:"\s*)?)?)?\Z')
+
+# Sentence boundaries used to split blocks that would overflow the completion budget
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?;:])\s+|\n+")
+
+# Blank lines between paragraphs, where long texts are split for concurrent translation
+PARAGRAPH_BOUNDARY_PATTERN = re.compile(r"\n\s*\n")
+
+# Streams whose latest output keeps recurring across the recent window have degenerated into a loop
+REPEAT_SCAN_CHARS = 1024
+REPEAT_TAIL_CHARS = 64
+REPEAT_LIMIT = 4
+REPEAT_CHECK_INTERVAL = 256
+
+# Japanese output runs up to about twice the English token count; the margin
+# covers very short blocks and the JSON framing of micro-batches
+OUTPUT_TOKEN_RATIO = 2.2
+OUTPUT_TOKEN_MARGIN = 64
+
+BATCH_INSTRUCTIONS = """The input is a JSON object {"items": [{"i": <index>, "t": <text>}, ...]}.
+Translate the "t" of every item independently and return a JSON object of the same shape,
+{"items": [{"i": <index>, "t": <translation>}, ...]}, with "i" first in each item and the items in the same order.
+Never merge, split, skip, or renumber items, and do not add any other keys or text."""
+
+
+# Batched token counts are split across the tokenizer's native threads
+TOKENIZER_THREADS = os.cpu_count() or 8
+
+# Batch API jobs finish within this window at a discounted rate
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_PENDING_STATUSES = {"validating", "in_progress", "finalizing"}
+
+# Keepalive pings stop once the translator has made no request for this long
+KEEPALIVE_IDLE_LIMIT_SECONDS = 600
+
+
+def _is_repeating(text: str) -> bool:
+    """Check whether the tail of the generated text recurs throughout the recent window"""
+    if len(text) < REPEAT_TAIL_CHARS * REPEAT_LIMIT:
+        return False
+    tail = text[-REPEAT_TAIL_CHARS:]
+    return text.count(tail, max(0, len(text) - REPEAT_SCAN_CHARS)) >= REPEAT_LIMIT
+
+
+class CompletionStream:
+    """Accumulates streamed chat completion chunks and flags degenerate repetition"""
+    
+    def __init__(self, on_delta: Optional[Callable[[str], None]] = None):
+        # Deltas are joined once at the end; += on an attribute copies the whole text per token
+        self._parts: List[str] = []
+        self.finish_reason = None
+        self.tokens_used = 0
+        self._on_delta = on_delta
+        # Only the most recent REPEAT_SCAN_CHARS are needed for the repetition check
+        self._window = ""
+        self._checked_parts = 0
+        self._unchecked_length = 0
+
+    def add(self, chunk) -> bool:
+        """Consume one chunk; returns False once the output has started looping"""
+        if chunk.usage:
+            self.tokens_used = chunk.usage.total_tokens
+        # Azure sends content-filter and usage chunks without choices
+        if not chunk.choices:
+            return True
+        
+        choice = chunk.choices[0]
+        delta = choice.delta.content if choice.delta else None
+        if delta:
+            self._parts.append(delta)
+            self._unchecked_length += len(delta)
+            if self._on_delta:
+                self._on_delta(delta)
+        if choice.finish_reason:
+            self.finish_reason = choice.finish_reason
+        
+        if self._unchecked_length >= REPEAT_CHECK_INTERVAL:
+            recent = "".join(self._parts[self._checked_parts:])
+            self._window = (self._window + recent)[-REPEAT_SCAN_CHARS:]
+            self._checked_parts = len(self._parts)
+            self._unchecked_length = 0
+            if _is_repeating(self._window):
+                self.finish_reason = "repetition"
+                return False
+        return True
+
+    def result(self) -> Tuple[str, Optional[str], int]:
+        """Return the generated text, the finish reason and the tokens used"""
+        return "".join(self._parts), self.finish_reason, self.tokens_used
 
 
 class AzureOpenAITranslator(ITranslator):
@@ -28,68 +152,27 @@ class AzureOpenAITranslator(ITranslator):
     def __init__(self, config: TranslationConfig = None):
         self.config = config or TranslationConfig()
         self._client = None
+        self._client_kwargs = {}
+        # One async client per event loop; shared by with_config() copies
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+        self._encoding = self._load_encoding()
+        # Shared by with_config() copies so any session's request counts as activity
+        self._activity = {"last_request": time.monotonic()}
         self._initialize_client()
+        self._start_keepalive()
         
-        # CVE-specific translation prompt
-        self.system_prompt = """You are an expert cybersecurity translator specializing in CVE (Common Vulnerabilities and Exposures) documentation. Your expertise includes vulnerability analysis, security assessment, and technical documentation translation.
-
-TRANSLATION PROTOCOL:
-
-🔒 NEVER TRANSLATE (Keep Original):
-- CVE identifiers: CVE-2025-41225, CVE-2024-12345
-- CVSS scores and ratings: CVSSv3, CVSSv4, 8.8, 9.0-10.0
-- Product names: VMware ESXi, vCenter Server, Microsoft Windows
-- Company names: VMware, Microsoft, Oracle, Cisco
-- Technical protocols: HTTP, HTTPS, SSH, RDP, SQL
-- File extensions: .exe, .dll, .jar, .php
-- URLs and domain names
-- Version numbers: 7.0.3, v8.2, build 20348
-- Port numbers: 443, 80, 22, 3389
-- Hash values and cryptographic identifiers
-- Command line syntax and code snippets
-
-✅ TRANSLATE WITH DOMAIN EXPERTISE:
-- Vulnerability descriptions → 脆弱性の説明
-- Security impact → セキュリティへの影響  
-- Attack vectors → 攻撃ベクター
-- Mitigation strategies → 緩和策
-- Risk assessment → リスク評価
-- System integrity → システムの整合性
-- Confidentiality → 機密性
-- Availability → 可用性
-- Authentication → 認証
-- Authorization → 認可
-- Privilege escalation → 権限昇格
-- Remote code execution → リモートコード実行
-- Denial of Service → サービス拒否
-- Cross-site scripting → クロスサイトスクリプティング
-- SQL injection → SQLインジェクション
-
-📋 TRANSLATION STANDARDS:
-1. Use formal Japanese business language (丁寧語・尊敬語) suitable for enterprise security documentation
-2. Maintain cybersecurity terminology consistency with Japanese security standards (JPCERT/CC, NISC)
-3. Preserve sentence structure and paragraph formatting
-4. Keep technical accuracy as the highest priority
-5. Use appropriate Japanese technical terms for security concepts
-6. Maintain professional tone throughout
-7. Preserve any formatting markers or special characters
-
-🎯 DOMAIN-SPECIFIC GUIDELINES:
-- Severity levels: Critical → 緊急, High → 重要, Medium → 中程度, Low → 低
-- Security controls: 
-  * Access control → アクセス制御
-  * Network segmentation → ネットワークセグメンテーション
-  * Endpoint protection → エンドポイント保護
-  * Incident response → インシデント対応
-- Compliance frameworks: Keep English (SOX, GDPR, HIPAA, etc.)
-
-🚨 CRITICAL CONSTRAINTS:
-- Do not invent or add extra CVEs, names, or product lines not present in the original input
-- Translate ONLY what exists in the source text
-- Never hallucinate additional vulnerability information
-- Preserve exact technical identifiers and version numbers
-
-Translate the following CVE-related text to professional Japanese:"""
+        # CVE-specific translation prompt; it is resent with every block, so keep it terse
+        self.system_prompt = """Translate CVE security advisories from English to formal business Japanese (丁寧語) per JPCERT/CC and NISC usage.
+Keep verbatim: CVE IDs, CVSS scores, versions and builds, vendor and product names, protocols, file names, URLs, ports, hashes, commands, compliance names.
+Severity: Critical→緊急, High→重要, Medium→中程度, Low→低.
+Keep sentence and paragraph structure and formatting marks. Translate only the given text; never add CVEs, products or details."""
+
+    def with_config(self, config: TranslationConfig) -> "AzureOpenAITranslator":
+        """Translator bound to another configuration, sharing this one's clients and tokenizer"""
+        translator = copy.copy(self)
+        translator.config = config
+        return translator
 
     def _initialize_client(self):
         """Initialize Azure OpenAI client"""
@@ -107,11 +190,19 @@ Translate the following CVE-related text to professional Japanese:"""
                 }
             )
         
+        self._client_kwargs = {
+            "api_key": azure_key,
+            "api_version": azure_api_version,
+            "azure_endpoint": azure_endpoint,
+            # The SDK backs off exponentially and honours Retry-After on 429 and 5xx responses
+            "max_retries": self.config.max_retries
+        }
+        
         try:
             self._client = AzureOpenAI(
-                api_key=azure_key,
-                api_version=azure_api_version,
-                azure_endpoint=azure_endpoint
+                **self._client_kwargs,
+                timeout=http_timeout(self.config.timeout_seconds),
+                http_client=get_shared_http_client()
             )
         except Exception as e:
             raise ConfigurationError(
@@ -119,78 +210,729 @@ Translate the following CVE-related text to professional Japanese:"""
                 error_code="AZURE_CLIENT_INIT_FAILED"
             )
 
-    def translate(self, request: TranslationRequest) -> TranslationResponse:
-        """Translate text using Azure OpenAI"""
+    def _start_keepalive(self):
+        """Ping the service from a daemon thread whenever the client sits idle
+        
+        Azure drops idle connections after about a minute, and the TLS handshake
+        that follows adds roughly a second to the next translation. Only the
+        synchronous pool is kept warm; async clients live for one event loop.
+        Pings stop after KEEPALIVE_IDLE_LIMIT_SECONDS without a request and
+        resume with the next one.
+        """
+        interval = self.config.keepalive_interval_seconds
+        if not interval:
+            return
+        
+        # A weak reference lets the translator be collected while the thread sleeps
+        translator_ref = weakref.ref(self)
+        
+        def keepalive():
+            while True:
+                time.sleep(interval)
+                translator = translator_ref()
+                if translator is None:
+                    return
+                idle = time.monotonic() - translator._activity["last_request"]
+                if interval <= idle < KEEPALIVE_IDLE_LIMIT_SECONDS:
+                    translator._ping()
+                del translator
+        
+        threading.Thread(target=keepalive, name="azure-openai-keepalive", daemon=True).start()
+
+    def _ping(self):
+        """Issue a token-free request so the pooled connection stays open"""
+        try:
+            self._client.models.list()
+        except Exception:
+            pass
+
+    def _mark_request(self):
+        """Record service activity, which defers keepalive pings"""
+        self._activity["last_request"] = time.monotonic()
+
+    def _load_encoding(self):
+        """Load the tokenizer for the configured model, if available"""
+        if tiktoken is None:
+            return None
+        try:
+            return tiktoken.encoding_for_model(self.config.model_name)
+        except Exception:
+            try:
+                return tiktoken.get_encoding("o200k_base")
+            except Exception:
+                return None
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text using the model tokenizer"""
+        if self._encoding is None:
+            # Rough estimate for English text when tiktoken is unavailable
+            return max(1, len(text) // 4)
+        # Ordinary encoding counts special-token markup as plain text instead of
+        # rejecting it, and skips the special-token scan
+        return len(self._encoding.encode_ordinary(text))
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts with a single tokenizer call"""
+        if self._encoding is None:
+            return [max(1, len(text) // 4) for text in texts]
+        return [
+            len(tokens)
+            for tokens in self._encoding.encode_ordinary_batch(texts, num_threads=TOKENIZER_THREADS)
+        ]
+
+    def _output_token_budget(self, messages: List[Dict[str, str]]) -> int:
+        """Size max_tokens to the text being translated instead of the configured ceiling"""
+        estimate = int(self.count_tokens(messages[-1]["content"]) * OUTPUT_TOKEN_RATIO) + OUTPUT_TOKEN_MARGIN
+        return min(self.config.max_tokens, estimate)
+
+    def _max_input_tokens(self) -> int:
+        """Largest block sent in one completion, leaving room for the longer translated output"""
+        return max(1, self.config.max_tokens // 2)
+
+    def _split_oversized(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Split text at sentence boundaries into pieces that fit the completion budget
+        
+        Pieces keep their trailing whitespace so joining them restores the original layout.
+        """
+        limit = limit or self._max_input_tokens()
+        if self.count_tokens(text) <= limit:
+            return [text]
+        
+        sentences = []
+        start = 0
+        for boundary in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+            sentences.append(text[start:boundary.end()])
+            start = boundary.end()
+        if start < len(text):
+            sentences.append(text[start:])
+        
+        pieces = []
+        current = ""
+        current_tokens = 0
+        for sentence, tokens in zip(sentences, self.count_tokens_batch(sentences)):
+            if current and current_tokens + tokens > limit:
+                pieces.append(current)
+                current = ""
+                current_tokens = 0
+            if tokens > limit:
+                pieces.extend(self._split_by_tokens(sentence, limit))
+                continue
+            current += sentence
+            current_tokens += tokens
+        if current:
+            pieces.append(current)
+        
+        return pieces
+
+    def _split_paragraphs(self, text: str) -> List[str]:
+        """Split a long text at paragraph breaks into chunks that are translated concurrently
+        
+        Paragraphs translate independently, so several short completions running in
+        parallel replace one long sequential generation. Chunks that still overflow
+        the completion budget are split further at sentence boundaries.
+        """
+        limit = self.config.parallel_chunk_tokens
+        boundaries = list(PARAGRAPH_BOUNDARY_PATTERN.finditer(text)) if limit else []
+        if not boundaries:
+            return self._split_oversized(text)
+        
+        paragraphs = []
+        start = 0
+        for boundary in boundaries:
+            paragraphs.append(text[start:boundary.end()])
+            start = boundary.end()
+        if start < len(text):
+            paragraphs.append(text[start:])
+        
+        chunks = []
+        current = ""
+        current_tokens = 0
+        for paragraph, tokens in zip(paragraphs, self.count_tokens_batch(paragraphs)):
+            if current and current_tokens + tokens > limit:
+                chunks.append(current)
+                current = ""
+                current_tokens = 0
+            current += paragraph
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        
+        return [piece for chunk in chunks for piece in self._split_oversized(chunk)]
+
+    def _split_truncated(self, text: str) -> List[str]:
+        """Split a block whose translation hit max_tokens into roughly halves
+        
+        Blocks within the output margin are returned whole: their truncation is a
+        runaway generation rather than a budget problem, and splitting would not help.
+        """
+        tokens = self.count_tokens(text)
+        if tokens <= OUTPUT_TOKEN_MARGIN:
+            return [text]
+        return self._split_oversized(text, (tokens + 1) // 2)
+
+    def _split_by_tokens(self, text: str, limit: int) -> List[str]:
+        """Hard-split a single over-long sentence into windows of at most limit tokens"""
+        if self._encoding is None:
+            step = limit * 4
+            return [text[i:i + step] for i in range(0, len(text), step)]
+        # Ordinary encoding takes special-token markup as plain text. Windows end before
+        # the first token of a character, so multibyte characters stay whole and a
+        # window never takes in tokens of a character cut short at its start
+        tokens = self._encoding.encode_ordinary(text)
+        _, offsets = self._encoding.decode_with_offsets(tokens)
+        cuts = [0]
+        start = 0
+        while start + limit < len(tokens):
+            end = start + limit
+            while end > start and offsets[end - 1] == offsets[end]:
+                end -= 1
+            if end == start:
+                # A single character longer than the limit
+                end = start + limit
+                while end < len(tokens) and offsets[end] == offsets[start]:
+                    end += 1
+                if end == len(tokens):
+                    break
+            cuts.append(offsets[end])
+            start = end
+        cuts.append(len(text))
+        return [text[start:end] for start, end in zip(cuts, cuts[1:]) if end > start]
+
+    async def _translate_pieces_async(
+        self, request: TranslationRequest, pieces: List[str]
+    ) -> List[TranslationResponse]:
+        """Translate the pieces of a split text concurrently, preserving order"""
+        semaphore = asyncio.Semaphore(self.config.piece_concurrency)
+        
+        async def translate_piece(piece: str) -> TranslationResponse:
+            async with semaphore:
+                return await self.translate_async(replace(request, text=piece.strip()))
+        
+        return list(await asyncio.gather(*(translate_piece(piece) for piece in pieces)))
+
+    def _join_pieces(
+        self,
+        request: TranslationRequest,
+        pieces: List[str],
+        responses: List[TranslationResponse],
+        start_time: float
+    ) -> TranslationResponse:
+        """Combine the translations of a split block into one response"""
+        finish_reasons = [response.metadata.get("finish_reason") for response in responses]
+        
+        return TranslationResponse(
+            translated_text="".join(
+                response.translated_text + piece[len(piece.rstrip()):]
+                for piece, response in zip(pieces, responses)
+            ).strip(),
+            original_text=request.text,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            confidence_score=min(response.confidence_score for response in responses),
+            processing_time=time.time() - start_time,
+            metadata={
+                "model": self.config.model_name,
+                "tokens_used": sum(response.metadata.get("tokens_used", 0) for response in responses),
+                "finish_reason": "length" if "length" in finish_reasons else finish_reasons[-1],
+                "pieces": len(pieces)
+            }
+        )
+
+    def _get_async_client(self) -> AsyncAzureOpenAI:
+        """Return the async client bound to the currently running event loop"""
+        # httpx connection pools cannot be shared across event loops, so each
+        # loop gets its own client; sessions on other threads run other loops
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                try:
+                    client = AsyncAzureOpenAI(
+                        **self._client_kwargs,
+                        http_client=create_async_http_client(self.config.timeout_seconds)
+                    )
+                except Exception as e:
+                    raise ConfigurationError(
+                        f"Failed to initialize async Azure OpenAI client: {str(e)}",
+                        error_code="AZURE_CLIENT_INIT_FAILED"
+                    )
+                self._async_clients[loop] = client
+        return client
+
+    async def _close_async_client(self):
+        """Close the running loop's async client and its connection pool, if one was opened"""
+        with self._async_clients_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def run_async(self, coroutine):
+        """Run coroutine on a new event loop, closing the async client it opened"""
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self._close_async_client()
+        
+        return asyncio.run(run())
+
+    def translate(
+        self,
+        request: TranslationRequest,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> TranslationResponse:
+        """Translate text using Azure OpenAI
+        
+        When responses are streamed, on_delta receives each fragment of a
+        single-piece translation as it arrives.
+        """
         if not self._client:
             raise TranslationServiceError("Client not initialized")
         
         if len(request.text.strip()) < 3:
-            return TranslationResponse(
-                translated_text=request.text,
-                original_text=request.text,
-                source_language=request.source_language,
-                target_language=request.target_language,
-                confidence_score=1.0
-            )
+            return self._passthrough_response(request)
         
         start_time = time.time()
         
+        # Long texts are translated in concurrent pieces; oversized ones would otherwise be truncated
+        pieces = self._split_paragraphs(request.text)
+        if len(pieces) > 1:
+            return self._translate_pieces(request, pieces, start_time)
+        
+        try:
+            content, finish_reason, tokens_used = self._complete(self._build_messages(request), on_delta)
+        except Exception as e:
+            raise self._map_service_error(e)
+        
+        # A truncated translation is retried in smaller pieces rather than returned cut off
+        if finish_reason == "length":
+            pieces = self._split_truncated(request.text)
+            if len(pieces) > 1:
+                return self._translate_pieces(request, pieces, start_time)
+        
+        try:
+            return self._build_response(request, content, finish_reason, tokens_used, start_time)
+        except Exception as e:
+            raise self._map_service_error(e)
+
+    def _translate_pieces(
+        self, request: TranslationRequest, pieces: List[str], start_time: float
+    ) -> TranslationResponse:
+        """Translate the pieces of a split block from synchronous code"""
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": request.text}
-            ]
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop in this thread, so the pieces can be translated concurrently
+            responses = self.run_async(self._translate_pieces_async(request, pieces))
+        else:
+            responses = [self.translate(replace(request, text=piece.strip())) for piece in pieces]
+        return self._join_pieces(request, pieces, responses, start_time)
+
+    async def translate_async(self, request: TranslationRequest) -> TranslationResponse:
+        """Translate text using the async Azure OpenAI client"""
+        if not self._client_kwargs:
+            raise TranslationServiceError("Client not initialized")
+        
+        if len(request.text.strip()) < 3:
+            return self._passthrough_response(request)
+        
+        start_time = time.time()
+        
+        # Long texts are translated in concurrent pieces; oversized ones would otherwise be truncated
+        pieces = self._split_paragraphs(request.text)
+        if len(pieces) > 1:
+            responses = await self._translate_pieces_async(request, pieces)
+            return self._join_pieces(request, pieces, responses, start_time)
+        
+        try:
+            content, finish_reason, tokens_used = await self._complete_async(
+                self._build_messages(request)
+            )
+        except Exception as e:
+            raise self._map_service_error(e)
+        
+        # A truncated translation is retried in smaller pieces rather than returned cut off
+        if finish_reason == "length":
+            pieces = self._split_truncated(request.text)
+            if len(pieces) > 1:
+                responses = await self._translate_pieces_async(request, pieces)
+                return self._join_pieces(request, pieces, responses, start_time)
+        
+        try:
+            return self._build_response(request, content, finish_reason, tokens_used, start_time)
+        except Exception as e:
+            raise self._map_service_error(e)
+
+    async def translate_many_async(
+        self,
+        requests: List[TranslationRequest],
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> List[TranslationResponse]:
+        """Translate several requests with a single chat completion
+        
+        Requests are sent as an indexed JSON array and the JSON-mode response is
+        mapped back by index; if any item is missing or the output does not parse,
+        each request is translated separately. When streaming, progress_callback
+        receives the number of items completed so far as the next one begins.
+        """
+        responses: List[Optional[TranslationResponse]] = [None] * len(requests)
+        pending = []
+        for index, request in enumerate(requests):
+            if len(request.text.strip()) < 3:
+                responses[index] = self._passthrough_response(request)
+            else:
+                pending.append(index)
+        
+        if len(pending) == 1:
+            responses[pending[0]] = await self.translate_async(requests[pending[0]])
+        elif pending:
+            pending_requests = [requests[index] for index in pending]
+            start_time = time.time()
+            
+            # An item is complete once the next item has started streaming; each
+            # delta is scanned once, plus any item start it cut off from the last
+            carry = ""
+            items_seen = 0
             
-            # Add context if provided
-            if request.context:
-                messages.insert(1, {
-                    "role": "system", 
-                    "content": f"Additional context: {request.context}"
-                })
+            def on_delta(delta: str):
+                nonlocal carry, items_seen
+                text = carry + delta
+                found = items_seen
+                scan_position = 0
+                for item in BATCH_ITEM_PATTERN.finditer(text):
+                    items_seen += 1
+                    scan_position = item.end()
+                partial = BATCH_ITEM_PREFIX_PATTERN.search(text, scan_position)
+                carry = partial.group(0) if partial else ""
+                if progress_callback and items_seen > found and items_seen > 1:
+                    progress_callback(items_seen - 1)
             
+            try:
+                content, finish_reason, tokens_used = await self._complete_async(
+                    self._build_batch_messages(pending_requests),
+                    on_delta,
+                    response_format={"type": "json_object"}
+                )
+            except Exception as e:
+                raise self._map_service_error(e)
+            
+            segments = self._split_batch_output(content, len(pending_requests))
+            
+            if segments is None:
+                # Fall back to one request per block
+                fallback = await asyncio.gather(
+                    *(self.translate_async(request) for request in pending_requests)
+                )
+                for index, translation in zip(pending, fallback):
+                    responses[index] = translation
+            else:
+                processing_time = time.time() - start_time
+                # The request's usage is shared out so per-item totals add up to it
+                share, remainder = divmod(tokens_used, len(pending_requests))
+                for position, (index, request, segment) in enumerate(zip(pending, pending_requests, segments)):
+                    responses[index] = TranslationResponse(
+                        translated_text=segment,
+                        original_text=request.text,
+                        source_language=request.source_language,
+                        target_language=request.target_language,
+                        confidence_score=self._calculate_confidence(finish_reason),
+                        processing_time=processing_time,
+                        metadata={
+                            "model": self.config.model_name,
+                            "tokens_used": share + (position < remainder),
+                            "finish_reason": finish_reason,
+                            "batch_size": len(pending_requests)
+                        }
+                    )
+        
+        return responses
+
+    async def _complete_async(
+        self,
+        messages: List[Dict[str, str]],
+        on_delta: Optional[Callable[[str], None]] = None,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, Optional[str], int]:
+        """Run a chat completion, streaming it when enabled
+        
+        Returns the generated text, the finish reason and the tokens used.
+        """
+        self._mark_request()
+        client = self._get_async_client()
+        options = {"response_format": response_format} if response_format else {}
+        
+        if not self.config.stream_responses:
+            response = await client.chat.completions.create(
+                model=self.config.model_name,
+                messages=messages,
+                max_tokens=self._output_token_budget(messages),
+                temperature=self.config.temperature,
+                **options
+            )
+            return (
+                response.choices[0].message.content or "",
+                response.choices[0].finish_reason,
+                response.usage.total_tokens if response.usage else 0
+            )
+        
+        stream = await client.chat.completions.create(
+            model=self.config.model_name,
+            messages=messages,
+            max_tokens=self._output_token_budget(messages),
+            temperature=self.config.temperature,
+            stream=True,
+            stream_options={"include_usage": True},
+            **options
+        )
+        
+        completion = CompletionStream(on_delta)
+        async for chunk in stream:
+            if not completion.add(chunk):
+                # Stop paying for a generation that is looping
+                await stream.close()
+                break
+        
+        return completion.result()
+
+    def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, Optional[str], int]:
+        """Synchronous counterpart of _complete_async"""
+        self._mark_request()
+        if not self.config.stream_responses:
             response = self._client.chat.completions.create(
                 model=self.config.model_name,
                 messages=messages,
-                max_tokens=self.config.max_tokens,
+                max_tokens=self._output_token_budget(messages),
                 temperature=self.config.temperature
             )
-            
-            translated_text = response.choices[0].message.content
-            if not translated_text:
-                raise TranslationServiceError("Empty response from Azure OpenAI")
-            
-            processing_time = time.time() - start_time
-            
-            return TranslationResponse(
-                translated_text=translated_text.strip(),
-                original_text=request.text,
-                source_language=request.source_language,
-                target_language=request.target_language,
-                confidence_score=self._calculate_confidence(response),
-                processing_time=processing_time,
-                metadata={
+            return (
+                response.choices[0].message.content or "",
+                response.choices[0].finish_reason,
+                response.usage.total_tokens if response.usage else 0
+            )
+        
+        stream = self._client.chat.completions.create(
+            model=self.config.model_name,
+            messages=messages,
+            max_tokens=self._output_token_budget(messages),
+            temperature=self.config.temperature,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        
+        completion = CompletionStream(on_delta)
+        for chunk in stream:
+            if not completion.add(chunk):
+                stream.close()
+                break
+        
+        return completion.result()
+
+    def submit_batch(self, requests: List[TranslationRequest]) -> str:
+        """Queue requests as a Batch API job and return its id
+        
+        Batch jobs complete within the 24 hour window at half the price of
+        synchronous calls, which suits document-scale jobs nobody waits on.
+        """
+        lines = []
+        for index, request in enumerate(requests):
+            messages = self._build_messages(request)
+            lines.append(_json_bytes({
+                "custom_id": f"block-{index}",
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
                     "model": self.config.model_name,
-                    "tokens_used": response.usage.total_tokens if response.usage else 0,
-                    "finish_reason": response.choices[0].finish_reason
+                    "messages": messages,
+                    "max_tokens": self._output_token_budget(messages),
+                    "temperature": self.config.temperature
                 }
+            }))
+        
+        self._mark_request()
+        try:
+            batch_file = self._client.files.create(
+                file=("translation_batch.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = self._client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/chat/completions",
+                completion_window=BATCH_COMPLETION_WINDOW
             )
-            
         except Exception as e:
-            if "rate limit" in str(e).lower():
+            raise self._map_service_error(e)
+        
+        return batch.id
+
+    def get_batch_status(self, batch_id: str) -> str:
+        """Return the Batch API status of a submitted job"""
+        self._mark_request()
+        try:
+            return self._client.batches.retrieve(batch_id).status
+        except Exception as e:
+            raise self._map_service_error(e)
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        requests: List[TranslationRequest]
+    ) -> Optional[Dict[int, TranslationResponse]]:
+        """Return responses of a finished batch job keyed by request index, or None while it runs"""
+        start_time = time.time()
+        self._mark_request()
+        
+        try:
+            batch = self._client.batches.retrieve(batch_id)
+            if batch.status in BATCH_PENDING_STATUSES:
+                return None
+            if batch.status != "completed" or not batch.output_file_id:
                 raise TranslationServiceError(
-                    f"Rate limit exceeded: {str(e)}",
-                    error_code="RATE_LIMIT_EXCEEDED"
+                    f"Batch job {batch_id} ended with status {batch.status}",
+                    error_code="BATCH_FAILED"
                 )
-            elif "authentication" in str(e).lower():
-                raise AuthenticationError(
-                    f"Authentication failed: {str(e)}",
-                    error_code="AZURE_AUTH_FAILED"
-                )
-            else:
-                raise TranslationServiceError(
-                    f"Translation failed: {str(e)}",
-                    error_code="TRANSLATION_FAILED"
+            output = self._client.files.content(batch.output_file_id).content
+        except Exception as e:
+            raise self._map_service_error(e)
+        
+        responses = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            index = int(record["custom_id"].rpartition("-")[2])
+            body = (record.get("response") or {}).get("body") or {}
+            if index >= len(requests) or not body.get("choices"):
+                continue
+            choice = body["choices"][0]
+            try:
+                responses[index] = self._build_response(
+                    requests[index],
+                    choice["message"].get("content"),
+                    choice.get("finish_reason"),
+                    (body.get("usage") or {}).get("total_tokens", 0),
+                    start_time
                 )
+            except TranslationServiceError:
+                continue
+        
+        return responses
+
+    def _build_batch_messages(self, requests: List[TranslationRequest]) -> List[Dict[str, str]]:
+        """Build chat messages that pack several requests into one prompt"""
+        items = _json_bytes(
+            {"items": [{"i": index, "t": request.text} for index, request in enumerate(requests)]}
+        ).decode("utf-8")
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "system", "content": BATCH_INSTRUCTIONS},
+            {"role": "user", "content": items}
+        ]
+        
+        # Blocks from the same document share their context
+        if requests[0].context:
+            messages.insert(2, {
+                "role": "system",
+                "content": f"Additional context: {requests[0].context}"
+            })
+        
+        return messages
+
+    def _split_batch_output(self, content: str, expected: int) -> Optional[List[str]]:
+        """Parse a JSON batch response, returning None if any item is missing"""
+        try:
+            items = _json_loads(content).get("items")
+        except (ValueError, AttributeError):
+            return None
+        if not isinstance(items, list):
+            return None
+        
+        segments = {}
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("i"), int) and isinstance(item.get("t"), str):
+                segments[item["i"]] = item["t"].strip()
+        
+        ordered = [segments.get(index) for index in range(expected)]
+        if len(segments) != expected or not all(ordered):
+            return None
+        return ordered
+
+    def _build_messages(self, request: TranslationRequest) -> List[Dict[str, str]]:
+        """Build chat messages for a translation request"""
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": request.text}
+        ]
+        
+        # Add context if provided
+        if request.context:
+            messages.insert(1, {
+                "role": "system", 
+                "content": f"Additional context: {request.context}"
+            })
+        
+        return messages
+
+    def _passthrough_response(self, request: TranslationRequest) -> TranslationResponse:
+        """Return the input unchanged for text too short to translate"""
+        return TranslationResponse(
+            translated_text=request.text,
+            original_text=request.text,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            confidence_score=1.0
+        )
+
+    def _build_response(
+        self,
+        request: TranslationRequest,
+        translated_text: Optional[str],
+        finish_reason: Optional[str],
+        tokens_used: int,
+        start_time: float
+    ) -> TranslationResponse:
+        """Convert chat completion output into a TranslationResponse"""
+        if not translated_text:
+            raise TranslationServiceError("Empty response from Azure OpenAI")
+        
+        processing_time = time.time() - start_time
+        
+        return TranslationResponse(
+            translated_text=translated_text.strip(),
+            original_text=request.text,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            confidence_score=self._calculate_confidence(finish_reason),
+            processing_time=processing_time,
+            metadata={
+                "model": self.config.model_name,
+                "tokens_used": tokens_used,
+                "finish_reason": finish_reason
+            }
+        )
+
+    def _map_service_error(self, e: Exception) -> Exception:
+        """Map SDK exceptions onto translation system exceptions"""
+        if isinstance(e, TranslationServiceError):
+            return e
+        if "rate limit" in str(e).lower():
+            return TranslationServiceError(
+                f"Rate limit exceeded: {str(e)}",
+                error_code="RATE_LIMIT_EXCEEDED"
+            )
+        elif "authentication" in str(e).lower():
+            return AuthenticationError(
+                f"Authentication failed: {str(e)}",
+                error_code="AZURE_AUTH_FAILED"
+            )
+        else:
+            return TranslationServiceError(
+                f"Translation failed: {str(e)}",
+                error_code="TRANSLATION_FAILED"
+            )
 
     def supports_language_pair(self, source: str, target: str) -> bool:
         """Check if the translator supports the language pair"""
@@ -200,17 +942,15 @@ Translate the following CVE-related text to professional Japanese:"""
         }
         return supported_pairs.get((source, target), False)
 
-    def _calculate_confidence(self, response) -> float:
-        """Calculate confidence score based on response metadata"""
-        # Basic confidence calculation based on finish reason
-        if hasattr(response.choices[0], 'finish_reason'):
-            if response.choices[0].finish_reason == "stop":
-                return 0.95
-            elif response.choices[0].finish_reason == "length":
-                return 0.7
-            else:
-                return 0.5
-        return 0.8
+    def _calculate_confidence(self, finish_reason: Optional[str]) -> float:
+        """Calculate confidence score based on the completion finish reason"""
+        if finish_reason == "stop":
+            return 0.95
+        elif finish_reason == "length":
+            return 0.7
+        elif finish_reason is None:
+            return 0.8
+        return 0.5
 
     def get_supported_models(self) -> list:
         """Get list of supported models"""
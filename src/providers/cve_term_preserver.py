@@ -4,36 +4,68 @@ Implements ITermPreserver interface for CVE-specific technical terms
 """
 
 import re
-from typing import List, Dict, Set
+from functools import lru_cache
+from typing import List, Dict, Set, Tuple
 from core.interfaces import ITermPreserver
 from core.models import CVETerms
 
 
+# Enhanced regex patterns for comprehensive term protection
+TERM_PATTERNS = {
+    'cve_ids': re.compile(r'CVE-\d{4}-\d{4,7}', re.IGNORECASE),
+    'vmsa_ids': re.compile(r'VMSA-\d{4}-\d{4}', re.IGNORECASE),
+    'cvss_scores': re.compile(r'CVSS[v]?\d+(\.\d+)?', re.IGNORECASE),
+    'score_ranges': re.compile(r'\d+\.\d+[-–]\d+\.\d+', re.IGNORECASE),
+    'version_numbers': re.compile(r'\b\d+\.\d+(?:\.\d+)*(?:\s*build\s*\d+)?\b', re.IGNORECASE),
+    'build_numbers': re.compile(r'\bbuild\s+\d+\b', re.IGNORECASE),
+    'company_names': re.compile(r'\b(VMware|Microsoft|Oracle|Adobe|Cisco|Apple|Google|Amazon|IBM|Dell|HP|Intel|AMD|NVIDIA|Broadcom)\b', re.IGNORECASE),
+    'product_names': re.compile(r'\b(ESXi|vCenter\s+Server|Workstation|Fusion|Windows|Office|Exchange|SharePoint|Chrome|Firefox|Safari|Cloud\s+Foundation|Telco\s+Cloud)\b', re.IGNORECASE),
+    'product_editions': re.compile(r'\b(Pro|Standard|Enterprise|Professional|Ultimate|Home)\b', re.IGNORECASE),
+    'urls': re.compile(r'https?://\S+', re.IGNORECASE),
+    'emails': re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.IGNORECASE),
+    'file_paths': re.compile(r'[a-zA-Z]:\\\S+|/\S+', re.IGNORECASE),
+    'ip_addresses': re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', re.IGNORECASE),
+    'mac_addresses': re.compile(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})', re.IGNORECASE),
+    'registry_keys': re.compile(r'HKEY_[A-Z_]+\\\S+', re.IGNORECASE),
+    'hash_values': re.compile(r'\b[a-fA-F0-9]{32,64}\b', re.IGNORECASE),
+    'port_numbers': re.compile(r'\b(?:port\s+)?\d{1,5}\b', re.IGNORECASE),
+    'file_extensions': re.compile(r'\.[a-zA-Z0-9]{2,5}\b', re.IGNORECASE)
+}
+
+# Texts whose extracted terms are remembered; a translation scans its source several times
+TERM_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def _term_alternation(keys: Tuple[str, ...]):
+    """Compile one alternation over keys, which are ordered longest first"""
+    return re.compile("|".join(map(re.escape, keys)))
+
+
+def _replace_all(text: str, replacements: Dict[str, str]) -> str:
+    """Substitute every key of replacements in a single left-to-right pass
+    
+    Longer keys are tried first, and replaced text is never rescanned, so a short
+    term cannot match inside a longer term or inside an earlier token.
+    """
+    keys = tuple(sorted((key for key in replacements if key), key=len, reverse=True))
+    if not text or not keys:
+        return text
+    return _term_alternation(keys).sub(lambda match: replacements[match.group(0)], text)
+
+
+# Full-match formats used to validate individual extracted terms
+CVE_ID_FORMAT = re.compile(r'^CVE-\d{4}-\d{4,7}$', re.IGNORECASE)
+CVSS_SCORE_FORMAT = re.compile(r'^CVSS[v]?\d+(\.\d+)?$', re.IGNORECASE)
+
+
 class CVETermPreserver(ITermPreserver):
     """Preserves CVE-specific technical terms during translation"""
     
     def __init__(self):
-        # Enhanced regex patterns for comprehensive term protection
-        self.patterns = {
-            'cve_ids': re.compile(r'CVE-\d{4}-\d{4,7}', re.IGNORECASE),
-            'vmsa_ids': re.compile(r'VMSA-\d{4}-\d{4}', re.IGNORECASE),
-            'cvss_scores': re.compile(r'CVSS[v]?\d+(\.\d+)?', re.IGNORECASE),
-            'score_ranges': re.compile(r'\d+\.\d+[-–]\d+\.\d+', re.IGNORECASE),
-            'version_numbers': re.compile(r'\b\d+\.\d+(?:\.\d+)*(?:\s*build\s*\d+)?\b', re.IGNORECASE),
-            'build_numbers': re.compile(r'\bbuild\s+\d+\b', re.IGNORECASE),
-            'company_names': re.compile(r'\b(VMware|Microsoft|Oracle|Adobe|Cisco|Apple|Google|Amazon|IBM|Dell|HP|Intel|AMD|NVIDIA|Broadcom)\b', re.IGNORECASE),
-            'product_names': re.compile(r'\b(ESXi|vCenter\s+Server|Workstation|Fusion|Windows|Office|Exchange|SharePoint|Chrome|Firefox|Safari|Cloud\s+Foundation|Telco\s+Cloud)\b', re.IGNORECASE),
-            'product_editions': re.compile(r'\b(Pro|Standard|Enterprise|Professional|Ultimate|Home)\b', re.IGNORECASE),
-            'urls': re.compile(r'https?://[^\s]+', re.IGNORECASE),
-            'emails': re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.IGNORECASE),
-            'file_paths': re.compile(r'[a-zA-Z]:\\[^\s]+|/[^\s]+', re.IGNORECASE),
-            'ip_addresses': re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', re.IGNORECASE),
-            'mac_addresses': re.compile(r'([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})', re.IGNORECASE),
-            'registry_keys': re.compile(r'HKEY_[A-Z_]+\\[^\s]+', re.IGNORECASE),
-            'hash_values': re.compile(r'\b[a-fA-F0-9]{32,64}\b', re.IGNORECASE),
-            'port_numbers': re.compile(r'\b(?:port\s+)?\d{1,5}\b', re.IGNORECASE),
-            'file_extensions': re.compile(r'\.[a-zA-Z0-9]{2,5}\b', re.IGNORECASE)
-        }
+        # Patterns are compiled once at import and shared by all instances
+        self.patterns = dict(TERM_PATTERNS)
+        self._cached_terms = lru_cache(maxsize=TERM_CACHE_SIZE)(self._scan_terms)
         
         # Additional known technical terms
         self.technical_keywords = {
@@ -50,7 +82,14 @@ class CVETermPreserver(ITermPreserver):
         """Extract all technical terms that should be preserved"""
         if not text:
             return []
-        
+        return list(self._cached_terms(text))
+
+    def strip_terms(self, text: str, replacement: str = " ") -> str:
+        """Replace every preserved term in text with replacement in one pass"""
+        return _replace_all(text, dict.fromkeys(self.extract_terms(text), replacement))
+
+    def _scan_terms(self, text: str) -> Tuple[str, ...]:
+        """Run every term pattern over text"""
         preserved_terms = set()
         
         # Extract using regex patterns
@@ -62,7 +101,7 @@ class CVETermPreserver(ITermPreserver):
             else:
                 preserved_terms.update(matches)
         
-        return list(preserved_terms)
+        return tuple(preserved_terms)
 
     def create_preservation_map(self, text: str) -> Dict[str, str]:
         """Create a mapping of terms to protection tokens"""
@@ -78,27 +117,13 @@ class CVETermPreserver(ITermPreserver):
 
     def apply_protection_tokens(self, text: str, preservation_map: Dict[str, str]) -> str:
         """Replace technical terms with protection tokens"""
-        protected_text = text
-        
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_terms = sorted(preservation_map.values(), key=len, reverse=True)
-        
-        for term in sorted_terms:
-            # Find the corresponding token
-            token = next(k for k, v in preservation_map.items() if v == term)
-            # Replace term with token
-            protected_text = protected_text.replace(term, token)
-        
-        return protected_text
+        # Invert the map once; reversed order keeps the first token of a repeated term
+        tokens = {term: token for token, term in reversed(list(preservation_map.items()))}
+        return _replace_all(text, tokens)
 
     def restore_preservation_map(self, text: str, preservation_map: Dict[str, str]) -> str:
         """Restore protection tokens back to original terms"""
-        restored_text = text
-        
-        for token, term in preservation_map.items():
-            restored_text = restored_text.replace(token, term)
-        
-        return restored_text
+        return _replace_all(text, preservation_map)
 
     def verify_preservation(self, original: str, translated: str) -> bool:
         """Verify that technical terms are preserved in translation"""
@@ -113,17 +138,8 @@ class CVETermPreserver(ITermPreserver):
 
     def get_cve_terms(self, text: str) -> CVETerms:
         """Extract categorized CVE terms from text"""
-        cve_terms = CVETerms()
-        
         if not text:
-            return cve_terms
-        
-        # Extract specific term categories
-        cve_terms.cve_ids = self.patterns['cve_ids'].findall(text)
-        cve_terms.cvss_scores = self.patterns['cvss_scores'].findall(text)
-        cve_terms.company_names = self.patterns['company_names'].findall(text)
-        cve_terms.product_names = self.patterns['product_names'].findall(text)
-        cve_terms.urls = self.patterns['urls'].findall(text)
+            return CVETerms()
         
         # Extract technical identifiers (combination of various patterns)
         tech_identifiers = []
@@ -133,9 +149,15 @@ class CVETermPreserver(ITermPreserver):
         tech_identifiers.extend(self.patterns['ip_addresses'].findall(text))
         tech_identifiers.extend(self.patterns['mac_addresses'].findall(text))
         
-        cve_terms.technical_identifiers = list(set(tech_identifiers))
-        
-        return cve_terms
+        # Extract specific term categories
+        return CVETerms(
+            cve_ids=self.patterns['cve_ids'].findall(text),
+            cvss_scores=self.patterns['cvss_scores'].findall(text),
+            company_names=self.patterns['company_names'].findall(text),
+            product_names=self.patterns['product_names'].findall(text),
+            urls=self.patterns['urls'].findall(text),
+            technical_identifiers=list(set(tech_identifiers))
+        )
 
     def create_preservation_map(self, text: str) -> Dict[str, str]:
         """Create a map of terms to preserve with their replacements"""
@@ -150,17 +172,11 @@ class CVETermPreserver(ITermPreserver):
 
     def apply_preservation_map(self, text: str, preservation_map: Dict[str, str]) -> str:
         """Apply preservation map to text (replace terms with placeholders)"""
-        modified_text = text
-        for term, placeholder in preservation_map.items():
-            modified_text = modified_text.replace(term, placeholder)
-        return modified_text
+        return _replace_all(text, preservation_map)
 
     def restore_preservation_map(self, text: str, preservation_map: Dict[str, str]) -> str:
         """Restore original terms from placeholders"""
-        restored_text = text
-        for term, placeholder in preservation_map.items():
-            restored_text = restored_text.replace(placeholder, term)
-        return restored_text
+        return _replace_all(text, {placeholder: term for term, placeholder in preservation_map.items()})
 
     def get_preservation_statistics(self, original: str, translated: str) -> Dict[str, any]:
         """Get detailed statistics about term preservation"""
@@ -203,9 +219,9 @@ class CVETermPreserver(ITermPreserver):
     def _validate_term_format(self, term: str, term_type: str) -> bool:
         """Validate format of specific term types"""
         if term_type == 'cve_ids':
-            return bool(re.match(r'^CVE-\d{4}-\d{4,7}$', term, re.IGNORECASE))
+            return bool(CVE_ID_FORMAT.match(term))
         elif term_type == 'cvss_scores':
-            return bool(re.match(r'^CVSS[v]?\d+(\.\d+)?$', term, re.IGNORECASE))
+            return bool(CVSS_SCORE_FORMAT.match(term))
         elif term_type == 'urls':
             return term.startswith(('http://', 'https://'))
         elif term_type == 'emails':
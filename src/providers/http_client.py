@@ -0,0 +1,60 @@
+"""
+Shared HTTP Client
+Pooled httpx clients used by the OpenAI and Azure OpenAI SDK clients
+"""
+
+import threading
+import importlib.util
+import httpx
+
+
+# HTTP/2 multiplexes concurrent requests over one TLS connection; it needs the h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool sized for bursts of concurrent translation and embedding requests
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=120)
+
+# Failed connects are retried in the transport; the SDKs retry HTTP error responses themselves
+TRANSPORT_RETRIES = 2
+CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def http_timeout(seconds: float = DEFAULT_TIMEOUT_SECONDS) -> httpx.Timeout:
+    """Request timeout that fails fast on unreachable hosts"""
+    return httpx.Timeout(seconds, connect=CONNECT_TIMEOUT_SECONDS)
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide sync client, so every SDK client draws on one connection pool"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    limits=HTTP_POOL_LIMITS,
+                    retries=TRANSPORT_RETRIES
+                ),
+                timeout=http_timeout()
+            )
+        return _shared_client
+
+
+def create_async_http_client(timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS) -> httpx.AsyncClient:
+    """Build an async client with the shared pool settings
+
+    Async connection pools are bound to the event loop that opened them, so
+    callers create one per loop instead of sharing a single instance.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=HTTP_POOL_LIMITS,
+            retries=TRANSPORT_RETRIES
+        ),
+        timeout=http_timeout(timeout_seconds)
+    )
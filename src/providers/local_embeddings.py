@@ -0,0 +1,69 @@
+"""
+Local Embedding Provider
+Implements IEmbeddingProvider with an on-device ONNX model through FastEmbed
+"""
+
+import os
+import numpy as np
+from typing import List, Optional
+
+try:
+    from fastembed import TextEmbedding
+except ImportError:  # Local validation is unavailable; the OpenAI provider is used instead
+    TextEmbedding = None
+
+from core.exceptions import EmbeddingError, ConfigurationError
+from providers.openai_embeddings import OpenAIEmbeddingProvider
+
+
+# Multilingual sentence model (384 dimensions, ~220 MB) that embeds English and
+# Japanese into a shared space, so no query/passage prefixes are needed
+DEFAULT_LOCAL_EMBEDDING_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+# Texts handed to the ONNX session per inference call
+LOCAL_EMBEDDING_BATCH_SIZE = 64
+
+LOCAL_EMBEDDINGS_AVAILABLE = TextEmbedding is not None
+
+
+class LocalEmbeddingProvider(OpenAIEmbeddingProvider):
+    """Embedding generation on the local CPU, removing the network round-trip from validation
+
+    Caching, normalization and similarity scoring are shared with the OpenAI
+    provider; only model loading and the per-chunk embedding call differ.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_LOCAL_EMBEDDING_MODEL,
+        cache_size: int = 4096,
+        threads: Optional[int] = None,
+        cache_directory: Optional[str] = None
+    ):
+        self._threads = threads or os.cpu_count()
+        super().__init__(model=model, cache_size=cache_size, cache_directory=cache_directory)
+
+    def _initialize_client(self):
+        """Load the ONNX model and determine its embedding dimension"""
+        if TextEmbedding is None:
+            raise ConfigurationError(
+                "fastembed is not installed",
+                error_code="FASTEMBED_MISSING",
+                details={"install": "pip install fastembed"}
+            )
+
+        try:
+            self._client = TextEmbedding(model_name=self.model, threads=self._threads)
+            self._dimension = len(self._request_embeddings(["test"])[0])
+        except Exception as e:
+            raise EmbeddingError(
+                f"Failed to load local embedding model {self.model}: {str(e)}",
+                error_code="LOCAL_EMBEDDING_INIT_FAILED"
+            )
+
+    def _request_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed a chunk of texts locally, returning normalized vectors in input order"""
+        return [
+            self._normalize(vector)
+            for vector in self._client.embed(texts, batch_size=LOCAL_EMBEDDING_BATCH_SIZE)
+        ]
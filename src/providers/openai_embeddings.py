@@ -4,21 +4,61 @@ Implements IEmbeddingProvider interface using OpenAI embeddings API
 """
 
 import os
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import List
+from typing import List, Optional, Union
 from openai import OpenAI
 
+try:
+    import diskcache
+except ImportError:  # Without diskcache embeddings are cached in process only
+    diskcache = None
+
 from core.interfaces import IEmbeddingProvider
 from core.exceptions import EmbeddingError, AuthenticationError
+from providers.http_client import get_shared_http_client
+
+
+# Maximum number of inputs the embeddings endpoint accepts in one request
+MAX_EMBEDDING_INPUTS = 2048
+
+# Chunks of a large batch are independent requests and are sent concurrently
+EMBEDDING_REQUEST_CONCURRENCY = 4
+
+# Embeddings are stored at half precision to halve cache memory; similarities
+# are computed in float32, where the rounding is well below scoring noise
+EMBEDDING_DTYPE = np.float16
+
+# On-disk embedding cache bound; at half precision a 1536-d vector is 3 KiB
+EMBEDDING_DISK_CACHE_BYTES = 512 * 1024 * 1024
 
 
 class OpenAIEmbeddingProvider(IEmbeddingProvider):
     """OpenAI-based embedding generation for translation validation"""
     
-    def __init__(self, model: str = "text-embedding-3-small"):
+    def __init__(
+        self,
+        model: str = "text-embedding-3-small",
+        cache_size: int = 4096,
+        cache_directory: Optional[str] = None
+    ):
         self.model = model
         self._client = None
         self._dimension = 1536  # Default for text-embedding-3-small
+        # Repeated boilerplate is embedded once; keyed by a digest of model and cleaned text
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._disk = self._open_disk_cache(cache_directory)
+        self._executor = ThreadPoolExecutor(
+            max_workers=EMBEDDING_REQUEST_CONCURRENCY,
+            thread_name_prefix="embeddings"
+        )
         self._initialize_client()
 
     def _initialize_client(self):
@@ -33,7 +73,7 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
             )
         
         try:
-            self._client = OpenAI(api_key=api_key)
+            self._client = OpenAI(api_key=api_key, http_client=get_shared_http_client())
             # Test connection and get actual dimension
             self._test_and_get_dimension()
         except Exception as e:
@@ -54,24 +94,26 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
             # Fall back to default dimension if test fails
             self._dimension = 1536
 
-    def get_embedding(self, text: str) -> List[float]:
-        """Generate embedding vector for text"""
+    def get_embedding(self, text: str) -> np.ndarray:
+        """Generate a unit-length embedding vector for text"""
         if not self._client:
             raise EmbeddingError("Client not initialized")
         
         if not text or not text.strip():
-            return [0.0] * self._dimension
+            return np.zeros(self._dimension, dtype=EMBEDDING_DTYPE)
         
         try:
             # Clean text for embedding
             clean_text = text.replace("\n", " ").strip()
+            key = self._cache_key(clean_text)
             
-            response = self._client.embeddings.create(
-                model=self.model,
-                input=clean_text
-            )
+            embedding = self._cache_get(key)
+            if embedding is not None:
+                return embedding
             
-            return response.data[0].embedding
+            embedding = self._request_embeddings([clean_text])[0]
+            self._cache_put(key, embedding)
+            return embedding
             
         except Exception as e:
             if "rate limit" in str(e).lower():
@@ -94,8 +136,11 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
         """Return the dimension of embeddings"""
         return self._dimension
 
-    def get_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts in batch"""
+    def get_batch_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate unit-length embeddings for multiple texts in batch
+        
+        Results are aligned with the input; blank texts get a zero vector.
+        """
         if not self._client:
             raise EmbeddingError("Client not initialized")
         
@@ -103,18 +148,48 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
             return []
         
         try:
-            # Clean texts
-            clean_texts = [text.replace("\n", " ").strip() for text in texts if text.strip()]
+            blank = np.zeros(self._dimension, dtype=EMBEDDING_DTYPE)
+            embeddings = [blank] * len(texts)
             
-            if not clean_texts:
-                return []
+            # Clean texts, remembering where each non-blank text came from
+            positions = [i for i, text in enumerate(texts) if text and text.strip()]
+            clean_texts = [texts[i].replace("\n", " ").strip() for i in positions]
+            keys = [self._cache_key(text) for text in clean_texts]
             
-            response = self._client.embeddings.create(
-                model=self.model,
-                input=clean_texts
-            )
+            # Serve cached texts and request each distinct uncached text once
+            missing = {}
+            for position, key, text in zip(positions, keys, clean_texts):
+                embedding = self._cache_get(key)
+                if embedding is None:
+                    missing.setdefault(key, text)
+                else:
+                    embeddings[position] = embedding
+            
+            missing_keys = list(missing)
+            missing_texts = list(missing.values())
+            fetched = {}
+            
+            # The embeddings endpoint accepts a bounded number of inputs per request
+            starts = range(0, len(missing_texts), MAX_EMBEDDING_INPUTS)
+            chunks = [missing_texts[start:start + MAX_EMBEDDING_INPUTS] for start in starts]
+            if len(chunks) > 1:
+                results = self._executor.map(self._request_embeddings, chunks)
+            else:
+                results = map(self._request_embeddings, chunks)
+            
+            for start, vectors in zip(starts, results):
+                # One disk transaction per chunk instead of a commit per embedding
+                with self._disk.transact() if self._disk is not None else nullcontext():
+                    for offset, vector in enumerate(vectors):
+                        key = missing_keys[start + offset]
+                        fetched[key] = vector
+                        self._cache_put(key, vector)
             
-            return [item.embedding for item in response.data]
+            for position, key in zip(positions, keys):
+                if key in fetched:
+                    embeddings[position] = fetched[key]
+            
+            return embeddings
             
         except Exception as e:
             raise EmbeddingError(
@@ -122,22 +197,98 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
                 error_code="BATCH_EMBEDDING_FAILED"
             )
 
-    def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
-        """Calculate cosine similarity between two embeddings"""
+    def _request_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed a chunk of texts with one request, returning normalized vectors in input order"""
+        response = self._client.embeddings.create(model=self.model, input=texts, encoding_format="base64")
+        vectors = [None] * len(texts)
+        for item in response.data:
+            vectors[item.index] = self._normalize(item.embedding)
+        return vectors
+
+    def _cache_key(self, clean_text: str) -> bytes:
+        """Digest of the model and cleaned text used as the embedding cache key"""
+        digest = hashlib.blake2b(self.model.encode("utf-8"), digest_size=16)
+        digest.update(b"\x00")
+        digest.update(clean_text.encode("utf-8"))
+        return digest.digest()
+
+    @staticmethod
+    def _open_disk_cache(directory: Optional[str]):
+        """Open the persistent embedding cache, so repeat validations survive restarts"""
+        if not directory or diskcache is None:
+            return None
+        try:
+            return diskcache.Cache(
+                directory,
+                size_limit=EMBEDDING_DISK_CACHE_BYTES,
+                eviction_policy="least-recently-used"
+            )
+        except Exception as e:
+            print(f"Warning: Could not open embedding cache at {directory}: {e}")
+            return None
+
+    def _cache_get(self, key: bytes) -> Optional[np.ndarray]:
+        """Return a cached embedding and mark it as recently used"""
+        with self._cache_lock:
+            embedding = self._cache.get(key)
+            if embedding is not None:
+                self._cache.move_to_end(key)
+                return embedding
+        
+        if self._disk is not None:
+            try:
+                stored = self._disk.get(key)
+            except Exception:
+                stored = None
+            if stored is not None:
+                embedding = np.frombuffer(stored, dtype=EMBEDDING_DTYPE)
+                self._cache_put(key, embedding, persist=False)
+                return embedding
+        return None
+
+    def _cache_put(self, key: bytes, embedding: np.ndarray, persist: bool = True):
+        """Cache an embedding, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._cache[key] = embedding
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        
+        if persist and self._disk is not None:
+            try:
+                self._disk.set(key, embedding.tobytes())
+            except Exception as e:
+                print(f"Warning: Could not persist embedding cache entry: {e}")
+
+    @staticmethod
+    def _normalize(embedding: Union[str, List[float]]) -> np.ndarray:
+        """Convert an API embedding to a unit-length half-precision vector
+        
+        Embeddings are requested base64-encoded so the little-endian float32
+        payload is viewed directly instead of materializing a list of floats.
+        """
+        if isinstance(embedding, str):
+            vector = np.frombuffer(base64.b64decode(embedding), dtype=np.float32)
+        else:
+            vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        return vector.astype(EMBEDDING_DTYPE)
+
+    def calculate_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+        """Calculate cosine similarity between two unit-length embeddings"""
         try:
-            vec1 = np.array(embedding1)
-            vec2 = np.array(embedding2)
+            vec1 = np.asarray(embedding1, dtype=np.float32)
+            vec2 = np.asarray(embedding2, dtype=np.float32)
             
-            # Calculate cosine similarity
-            dot_product = np.dot(vec1, vec2)
-            magnitude1 = np.linalg.norm(vec1)
-            magnitude2 = np.linalg.norm(vec2)
+            # Embeddings are normalized when fetched, so the float32 BLAS dot is the cosine
+            similarity = float(np.vdot(vec1, vec2))
             
-            if magnitude1 == 0 or magnitude2 == 0:
+            # Blank texts are embedded as zero vectors; only an exact zero needs the scan
+            if similarity == 0.0 and (not vec1.any() or not vec2.any()):
                 return 0.0
             
-            similarity = dot_product / (magnitude1 * magnitude2)
-            
             # Normalize to 0-1 range
             return max(0.0, min(1.0, (similarity + 1) / 2))
             
@@ -147,6 +298,32 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
                 error_code="SIMILARITY_CALCULATION_FAILED"
             )
 
+    def calculate_similarities(
+        self, embeddings1: List[np.ndarray], embeddings2: List[np.ndarray]
+    ) -> List[float]:
+        """Calculate row-wise cosine similarity between two lists of unit-length embeddings"""
+        try:
+            matrix1 = np.asarray(embeddings1, dtype=np.float32)
+            matrix2 = np.asarray(embeddings2, dtype=np.float32)
+            
+            if matrix1.size == 0:
+                return []
+            
+            similarities = np.einsum('ij,ij->i', matrix1, matrix2)
+            
+            # Zero vectors (blank texts) get a similarity of 0
+            blank = ~(matrix1.any(axis=1) & matrix2.any(axis=1))
+            similarities[blank] = -1.0
+            
+            # Normalize to 0-1 range
+            return np.clip((similarities + 1) / 2, 0.0, 1.0).tolist()
+            
+        except Exception as e:
+            raise EmbeddingError(
+                f"Similarity calculation failed: {str(e)}",
+                error_code="SIMILARITY_CALCULATION_FAILED"
+            )
+
     def test_connection(self) -> dict:
         """Test OpenAI connection"""
         try:
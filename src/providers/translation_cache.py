@@ -0,0 +1,126 @@
+"""
+Translation Cache
+Persistent LRU cache for translator output keyed by source text, model, target language and prompt
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import diskcache
+except ImportError:  # Without diskcache only the in-process layer is used
+    diskcache = None
+
+
+class TranslationCache:
+    """Two-level translation cache: an in-process LRU in front of an on-disk store"""
+
+    def __init__(
+        self,
+        directory: str = ".translation_cache",
+        max_memory_entries: int = 4096,
+        size_limit_bytes: int = 256 * 1024 * 1024
+    ):
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        self.hits = 0
+        self.misses = 0
+
+        if diskcache is not None:
+            try:
+                self._disk = diskcache.Cache(
+                    directory,
+                    size_limit=size_limit_bytes,
+                    eviction_policy="least-recently-used"
+                )
+            except Exception as e:
+                print(f"Warning: Could not open translation cache at {directory}: {e}")
+
+    @staticmethod
+    def make_key(
+        text: str,
+        model: str,
+        target_language: str,
+        system_prompt: str = "",
+        context: str = "",
+        temperature: float = 0.0
+    ) -> str:
+        """Build a compact cache key for a translation
+        
+        The prompt, request context and temperature are part of the key so that
+        editing any of them stops replaying translations made under the old ones.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (text, model, target_language, system_prompt, context, repr(temperature)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached translation for key, or None"""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+
+        if self._disk is not None:
+            try:
+                value = self._disk.get(key)
+            except Exception:
+                value = None
+            if value is not None:
+                self._remember(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: str):
+        """Store a translation in both cache layers"""
+        self._remember(key, value)
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value)
+            except Exception as e:
+                print(f"Warning: Could not persist translation cache entry: {e}")
+
+    def clear(self):
+        """Remove all cached translations"""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+        if self._disk is not None:
+            try:
+                self._disk.clear()
+            except Exception:
+                pass
+
+    def get_statistics(self) -> dict:
+        """Return cache hit statistics"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'memory_entries': len(self._memory),
+            'persistent': self._disk is not None
+        }
+
+    def _remember(self, key: str, value: str):
+        """Insert into the in-process LRU, evicting the oldest entry when full"""
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
@@ -3,8 +3,9 @@ Semantic Validator
 Implements IValidator interface using embedding-based semantic similarity
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import time
+import numpy as np
 
 from core.interfaces import IValidator, IEmbeddingProvider
 from core.models import ValidationResult, TranslationQuality
@@ -26,8 +27,14 @@ class SemanticValidator(IValidator):
             TranslationQuality.POOR: 0.0
         }
 
-    def validate(self, original: str, translated: str, **kwargs) -> ValidationResult:
-        """Validate translation using semantic similarity"""
+    def validate(
+        self, original: str, translated: str, quality_threshold: Optional[float] = None, **kwargs
+    ) -> ValidationResult:
+        """Validate translation using semantic similarity
+        
+        quality_threshold overrides the validator's own for this call, so callers
+        with their own settings can share one validator.
+        """
         if not original or not translated:
             return ValidationResult(
                 similarity_score=0.0,
@@ -41,8 +48,7 @@ class SemanticValidator(IValidator):
             start_time = time.time()
             
             # Get embeddings for both texts
-            original_embedding = self.embedding_provider.get_embedding(original)
-            translated_embedding = self.embedding_provider.get_embedding(translated)
+            original_embedding, translated_embedding = self._embed_pair(original, translated)
             
             # Calculate semantic similarity
             similarity_score = self.embedding_provider.calculate_similarity(
@@ -69,7 +75,8 @@ class SemanticValidator(IValidator):
                     'processing_time': processing_time,
                     'original_length': len(original),
                     'translated_length': len(translated),
-                    'length_ratio': len(translated) / len(original) if original else 0
+                    'length_ratio': len(translated) / len(original) if original else 0,
+                    'meets_threshold': similarity_score >= self._threshold(quality_threshold)
                 },
                 suggestions=suggestions
             )
@@ -80,6 +87,26 @@ class SemanticValidator(IValidator):
                 error_code="SEMANTIC_VALIDATION_FAILED"
             )
 
+    def calculate_similarity(self, text1: str, text2: str) -> float:
+        """Calculate semantic similarity between two texts, e.g. an original and its back translation"""
+        if not text1 or not text2:
+            return 0.0
+        
+        try:
+            return self.embedding_provider.calculate_similarity(*self._embed_pair(text1, text2))
+        except Exception as e:
+            raise ValidationError(
+                f"Similarity calculation failed: {str(e)}",
+                error_code="SIMILARITY_CALCULATION_FAILED"
+            )
+
+    def _embed_pair(self, text1: str, text2: str) -> tuple:
+        """Embed two texts, in one request when the provider supports batching"""
+        if hasattr(self.embedding_provider, 'get_batch_embeddings'):
+            embedding1, embedding2 = self.embedding_provider.get_batch_embeddings([text1, text2])
+            return embedding1, embedding2
+        return self.embedding_provider.get_embedding(text1), self.embedding_provider.get_embedding(text2)
+
     def get_validation_metrics(self) -> List[str]:
         """Return available validation metrics"""
         return [
@@ -125,6 +152,26 @@ class SemanticValidator(IValidator):
         # Average confidence
         return sum(confidence_factors) / len(confidence_factors)
 
+    def _determine_qualities(self, similarity_scores: np.ndarray) -> List[TranslationQuality]:
+        """Vectorized _determine_quality for an array of similarity scores"""
+        levels = sorted(self.quality_thresholds.items(), key=lambda item: item[1])
+        bounds = np.array([threshold for _, threshold in levels])
+        indices = np.maximum(np.searchsorted(bounds, similarity_scores, side='right') - 1, 0)
+        return [levels[index][0] for index in indices]
+
+    def _calculate_confidences(
+        self, original_lengths: np.ndarray, translated_lengths: np.ndarray, similarity_scores: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized _calculate_confidence over lengths of non-empty text pairs"""
+        length_ratios = translated_lengths / original_lengths
+        length_confidence = np.select(
+            [(length_ratios >= 0.5) & (length_ratios <= 2.0), (length_ratios >= 0.3) & (length_ratios <= 3.0)],
+            [1.0, 0.8],
+            0.5
+        )
+        complexity_confidence = np.clip(original_lengths / 1000, 0.3, 1.0)
+        return (similarity_scores + length_confidence + complexity_confidence) / 3
+
     def _generate_suggestions(self, similarity_score: float, quality: TranslationQuality) -> List[str]:
         """Generate improvement suggestions based on validation results"""
         suggestions = []
@@ -145,58 +192,95 @@ class SemanticValidator(IValidator):
         
         return suggestions
 
-    def batch_validate(self, text_pairs: List[tuple]) -> List[ValidationResult]:
-        """Validate multiple translation pairs in batch"""
+    def batch_validate(
+        self, text_pairs: List[tuple], quality_threshold: Optional[float] = None
+    ) -> List[ValidationResult]:
+        """Validate multiple translation pairs in batch
+        
+        Originals and translations are embedded in a single request and all
+        similarities are computed in one vectorized pass.
+        """
         results = []
+        threshold = self._threshold(quality_threshold)
+        
+        if not text_pairs:
+            return results
         
         try:
+            start_time = time.time()
+            
             # Extract texts for batch embedding
             original_texts = [pair[0] for pair in text_pairs]
             translated_texts = [pair[1] for pair in text_pairs]
             
-            # Get batch embeddings
-            original_embeddings = self.embedding_provider.get_batch_embeddings(original_texts)
-            translated_embeddings = self.embedding_provider.get_batch_embeddings(translated_texts)
+            # Get embeddings for both sides with one batched request, stacked once into a matrix
+            embeddings = np.stack(self.embedding_provider.get_batch_embeddings(original_texts + translated_texts))
+            original_embeddings = embeddings[:len(text_pairs)]
+            translated_embeddings = embeddings[len(text_pairs):]
+            
+            if hasattr(self.embedding_provider, 'calculate_similarities'):
+                similarity_scores = self.embedding_provider.calculate_similarities(
+                    original_embeddings, translated_embeddings
+                )
+            else:
+                similarity_scores = [
+                    self.embedding_provider.calculate_similarity(original_embedding, translated_embedding)
+                    for original_embedding, translated_embedding in zip(original_embeddings, translated_embeddings)
+                ]
+            
+            processing_time = (time.time() - start_time) / len(text_pairs)
+            
+            # Score quality and confidence for all pairs at once
+            scores = np.asarray(similarity_scores, dtype=np.float64)
+            original_lengths = np.fromiter((len(text) for text in original_texts), dtype=np.float64, count=len(text_pairs))
+            translated_lengths = np.fromiter((len(text) for text in translated_texts), dtype=np.float64, count=len(text_pairs))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                confidence_scores = self._calculate_confidences(original_lengths, translated_lengths, scores)
+            qualities = self._determine_qualities(scores)
             
             # Process each pair
-            for i, (original, translated) in enumerate(text_pairs):
-                if i < len(original_embeddings) and i < len(translated_embeddings):
-                    similarity_score = self.embedding_provider.calculate_similarity(
-                        original_embeddings[i], translated_embeddings[i]
-                    )
-                    
-                    quality = self._determine_quality(similarity_score)
-                    confidence_score = self._calculate_confidence(original, translated, similarity_score)
-                    suggestions = self._generate_suggestions(similarity_score, quality)
-                    
-                    result = ValidationResult(
-                        similarity_score=similarity_score,
-                        quality=quality,
-                        technical_terms_preserved=True,
-                        confidence_score=confidence_score,
-                        suggestions=suggestions
-                    )
-                    results.append(result)
-                else:
-                    # Fallback for failed embeddings
+            for index, ((original, translated), similarity_score) in enumerate(zip(text_pairs, similarity_scores)):
+                if not original or not translated:
                     results.append(ValidationResult(
                         similarity_score=0.0,
                         quality=TranslationQuality.POOR,
                         technical_terms_preserved=False,
                         confidence_score=0.0,
-                        suggestions=["Failed to process embeddings"]
+                        suggestions=["Empty text provided"]
                     ))
+                    continue
+                
+                quality = qualities[index]
+                confidence_score = float(confidence_scores[index])
+                suggestions = self._generate_suggestions(similarity_score, quality)
+                
+                results.append(ValidationResult(
+                    similarity_score=similarity_score,
+                    quality=quality,
+                    technical_terms_preserved=True,
+                    confidence_score=confidence_score,
+                    details={
+                        'processing_time': processing_time,
+                        'original_length': len(original),
+                        'translated_length': len(translated),
+                        'length_ratio': len(translated) / len(original),
+                        'meets_threshold': similarity_score >= threshold
+                    },
+                    suggestions=suggestions
+                ))
             
         except Exception as e:
             # Return error results for all pairs
-            for _ in text_pairs:
-                results.append(ValidationResult(
+            results = [
+                ValidationResult(
                     similarity_score=0.0,
                     quality=TranslationQuality.POOR,
                     technical_terms_preserved=False,
                     confidence_score=0.0,
                     suggestions=[f"Batch validation error: {str(e)}"]
-                ))
+                )
+                for _ in text_pairs
+            ]
         
         return results
 
@@ -207,6 +291,10 @@ class SemanticValidator(IValidator):
         else:
             raise ValueError("Quality threshold must be between 0.0 and 1.0")
 
+    def _threshold(self, quality_threshold: Optional[float]) -> float:
+        """Per-call quality threshold, defaulting to the validator's own"""
+        return self.quality_threshold if quality_threshold is None else quality_threshold
+
     def get_quality_threshold(self) -> float:
         """Get current quality threshold"""
         return self.quality_threshold
\ No newline at end of file
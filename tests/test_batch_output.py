@@ -0,0 +1,87 @@
+"""
+Indexed JSON batch responses: parsing, streamed progress and token accounting
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from core.models import TranslationConfig, TranslationRequest
+from providers.azure_translator import AzureOpenAITranslator
+
+
+TEXTS = ["First advisory text.", "Second advisory text.", "Third advisory text."]
+
+
+@pytest.fixture
+def translator():
+    """A translator with completions stubbed out per test, without any client"""
+    translator = object.__new__(AzureOpenAITranslator)
+    translator.config = TranslationConfig()
+    translator.system_prompt = "Translate to Japanese."
+    return translator
+
+
+def _batch(*texts):
+    return json.dumps({"items": [{"i": index, "t": text} for index, text in enumerate(texts)]})
+
+
+def _stub_completion(translator, deltas, tokens_used):
+    """Stream deltas to the batch's on_delta and return their concatenation"""
+    async def complete(messages, on_delta=None, response_format=None):
+        for delta in deltas:
+            on_delta(delta)
+        return "".join(deltas), "stop", tokens_used
+    translator._complete_async = complete
+
+
+def test_split_batch_output_maps_items_by_index(translator):
+    content = json.dumps({"items": [{"i": 1, "t": " 二つ目 "}, {"i": 0, "t": "一つ目"}]})
+    assert translator._split_batch_output(content, 2) == ["一つ目", "二つ目"]
+
+
+@pytest.mark.parametrize("content", [
+    _batch("一つ目"),
+    _batch("一つ目", "二つ目", "三つ目"),
+    json.dumps({"items": [{"i": 0, "t": "一つ目"}, {"i": 0, "t": "二つ目"}]}),
+    json.dumps({"items": [{"i": 0, "t": "一つ目"}, {"i": 1, "t": ""}]}),
+    _batch("一つ目", "二つ目")[:-2],
+    '["一つ目", "二つ目"]',
+    json.dumps({"items": "一つ目"}),
+])
+def test_split_batch_output_rejects_wrong_count_or_malformed_json(translator, content):
+    assert translator._split_batch_output(content, 2) is None
+
+
+def _progress(translator, deltas):
+    _stub_completion(translator, deltas, 30)
+    progress = []
+    requests = [TranslationRequest(text=text) for text in TEXTS]
+    asyncio.run(translator.translate_many_async(requests, progress.append))
+    return progress
+
+
+def test_progress_counts_items_split_across_deltas(translator):
+    """Item starts cut anywhere between two deltas are counted once"""
+    content = _batch("一つ目", "二つ目", "三つ目")
+    for cut in range(1, len(content)):
+        progress = _progress(translator, [content[:cut], content[cut:]])
+        assert progress[-1] == 2 and progress == sorted(set(progress)), cut
+
+
+def test_progress_reports_each_item_as_the_next_begins(translator):
+    content = _batch("一つ目", "二つ目", "三つ目")
+    assert _progress(translator, list(content)) == [1, 2]
+
+
+@pytest.mark.parametrize("tokens_used", [0, 2, 3, 100])
+def test_batch_tokens_are_shared_out_in_full(translator, tokens_used):
+    _stub_completion(translator, [_batch("一つ目", "二つ目", "三つ目")], tokens_used)
+    requests = [TranslationRequest(text=text) for text in TEXTS]
+    responses = asyncio.run(translator.translate_many_async(requests))
+    
+    shares = [response.metadata["tokens_used"] for response in responses]
+    assert sum(shares) == tokens_used
+    assert max(shares) - min(shares) <= 1
+    assert [response.translated_text for response in responses] == ["一つ目", "二つ目", "三つ目"]
@@ -0,0 +1,108 @@
+"""
+Length buckets and in-flight deduplication shared by the batches of one job
+"""
+
+import asyncio
+
+import pytest
+
+from core.interfaces import ITranslator
+from core.models import TranslationResponse
+from orchestration.translation_orchestrator import BatchScheduler, TranslationOrchestrator
+from providers.cve_term_preserver import CVETermPreserver
+
+
+BUCKETS = ((256, 64, 30), (2048, 32, 90), (8192, 8, 300))
+
+
+class StubTranslator(ITranslator):
+    """Translates by tagging texts; requests wait on `release` and fail with `error` if set"""
+
+    def __init__(self):
+        self.requests = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.error = None
+
+    def translate(self, request):
+        raise NotImplementedError
+
+    async def translate_many_async(self, requests, progress_callback=None):
+        self.requests.append([request.text for request in requests])
+        self.started.set()
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return [
+            TranslationResponse(
+                translated_text=f"訳: {request.text}",
+                original_text=request.text,
+                source_language=request.source_language,
+                target_language=request.target_language,
+                confidence_score=0.95
+            )
+            for request in requests
+        ]
+
+    def supports_language_pair(self, source, target):
+        return True
+
+
+def _orchestrator(translator):
+    return TranslationOrchestrator(translator=translator, validator=None, term_preserver=CVETermPreserver())
+
+
+def _translate(orchestrator, texts, scheduler):
+    return orchestrator.translate_batch_async(texts, validate=False, preserve_terms=False, scheduler=scheduler)
+
+
+@pytest.mark.parametrize("tokens, bucket", [(0, 0), (255, 0), (256, 1), (2047, 1), (2048, 2), (100000, 2)])
+def test_requests_are_routed_to_their_length_bucket(tokens, bucket):
+    assert BatchScheduler(BUCKETS).bucket_for(tokens) == bucket
+
+
+def test_max_concurrency_caps_every_bucket():
+    async def limits():
+        return [semaphore._value for semaphore in BatchScheduler(BUCKETS, max_concurrency=16).semaphores]
+    assert asyncio.run(limits()) == [16, 16, 8]
+
+
+def test_duplicate_texts_share_one_request():
+    async def run():
+        translator = StubTranslator()
+        orchestrator = _orchestrator(translator)
+        scheduler = BatchScheduler(BUCKETS)
+        first = asyncio.create_task(_translate(orchestrator, ["Header", "Header", "Body"], scheduler))
+        await translator.started.wait()
+        # A later batch of the same job borrows the in-flight translation
+        second = asyncio.create_task(_translate(orchestrator, ["Header"], scheduler))
+        await asyncio.sleep(0)
+        translator.release.set()
+        return translator, await first, await second
+
+    translator, first, second = asyncio.run(run())
+    assert translator.requests == [["Header", "Body"]]
+    assert [result['translated_text'] for result in first + second] == [
+        "訳: Header", "訳: Header", "訳: Body", "訳: Header"
+    ]
+
+
+def test_failed_request_fails_its_borrowers_and_is_released():
+    async def run():
+        translator = StubTranslator()
+        translator.error = RuntimeError("service unavailable")
+        orchestrator = _orchestrator(translator)
+        scheduler = BatchScheduler(BUCKETS)
+        first = asyncio.create_task(_translate(orchestrator, ["Header", "Header"], scheduler))
+        await translator.started.wait()
+        second = asyncio.create_task(_translate(orchestrator, ["Header"], scheduler))
+        await asyncio.sleep(0)
+        translator.release.set()
+        return translator, scheduler, await first, await second
+
+    translator, scheduler, first, second = asyncio.run(run())
+    assert translator.requests == [["Header"]]
+    assert [result['success'] for result in first + second] == [False, False, False]
+    assert all(result['error'] == "service unavailable" for result in first + second)
+    # A later batch retries the text instead of borrowing the failure
+    assert "Header" not in scheduler.in_flight
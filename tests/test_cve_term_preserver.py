@@ -0,0 +1,21 @@
+"""
+Term extraction on mixed English/Japanese advisories
+"""
+
+from providers.cve_term_preserver import CVETermPreserver, TERM_PATTERNS
+
+
+MIXED_TEXT = "VMware ESXi 8.0の脆弱性 CVE-2025-41225では、CVSSv3 基本値8.8です。ポート443で"
+
+
+def test_digits_run_into_japanese_are_not_terms():
+    """Unicode word boundaries keep 8.0の and 値8.8 out of the version and port terms"""
+    assert TERM_PATTERNS['version_numbers'].findall(MIXED_TEXT) == []
+    assert TERM_PATTERNS['port_numbers'].findall(MIXED_TEXT) == ['8', '2025']
+
+
+def test_extract_terms_on_mixed_text():
+    """Identifiers embedded in Japanese text are still extracted"""
+    terms = set(CVETermPreserver().extract_terms(MIXED_TEXT))
+    assert {'CVE-2025-41225', 'VMware', 'ESXi'} <= terms
+    assert '8.8' not in terms
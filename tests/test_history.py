@@ -0,0 +1,153 @@
+"""
+Translation history persistence across app sessions
+"""
+
+import json
+import os
+import types
+
+import pytest
+import streamlit as st
+import streamlit.user_info
+from streamlit.testing.v1 import AppTest
+
+import providers.azure_translator
+import providers.openai_embeddings
+
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "modular_app.py")
+
+SAMPLE = "VMware vCenter Server has a vulnerability CVE-2025-41225."
+
+
+def _chunk(content=None, finish_reason=None, total_tokens=None):
+    choices = [] if content is None else [types.SimpleNamespace(
+        delta=types.SimpleNamespace(content=content), finish_reason=finish_reason
+    )]
+    usage = types.SimpleNamespace(total_tokens=total_tokens) if total_tokens else None
+    return types.SimpleNamespace(choices=choices, usage=usage)
+
+
+def _reply(messages):
+    """Echo the user message back as the translation, item by item for batches"""
+    user = messages[-1]['content']
+    if user.startswith('{"items"'):
+        items = json.loads(user)["items"]
+        return json.dumps({"items": [{"i": item["i"], "t": item["t"]} for item in items]})
+    return user
+
+
+class _Stream:
+    def __init__(self, content):
+        self.chunks = [_chunk(content, "stop"), _chunk(total_tokens=10)]
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    def close(self):
+        pass
+
+
+class _Completions:
+    def create(self, messages, stream=False, **kwargs):
+        if stream:
+            return _Stream(_reply(messages))
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(
+                message=types.SimpleNamespace(content=_reply(messages)), finish_reason="stop"
+            )],
+            usage=types.SimpleNamespace(total_tokens=10)
+        )
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, messages, stream=False, **kwargs):
+        return super().create(messages, stream=stream, **kwargs)
+
+
+class FakeAzureOpenAI:
+    def __init__(self, **kwargs):
+        self.chat = types.SimpleNamespace(completions=_Completions())
+
+
+class FakeAsyncAzureOpenAI:
+    def __init__(self, **kwargs):
+        self.chat = types.SimpleNamespace(completions=_AsyncCompletions())
+
+    async def close(self):
+        pass
+
+
+class FakeOpenAI:
+    def __init__(self, **kwargs):
+        self.embeddings = types.SimpleNamespace(create=self._embed)
+
+    @staticmethod
+    def _embed(input, **kwargs):
+        texts = input if isinstance(input, list) else [input]
+        return types.SimpleNamespace(data=[
+            types.SimpleNamespace(index=i, embedding=[1.0, 0.5, 0.25]) for i in range(len(texts))
+        ])
+
+
+@pytest.fixture
+def user(monkeypatch, tmp_path):
+    """Run the app against fake clients in tmp_path; set user['email'] to sign in"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AZURE_OPENAI_KEY", "key")
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com/")
+    monkeypatch.setenv("OPENAI_API_KEY", "key")
+    monkeypatch.setattr(providers.azure_translator, "AzureOpenAI", FakeAzureOpenAI)
+    monkeypatch.setattr(providers.azure_translator, "AsyncAzureOpenAI", FakeAsyncAzureOpenAI)
+    monkeypatch.setattr(providers.openai_embeddings, "OpenAI", FakeOpenAI)
+
+    signed_in = {}
+
+    def user_info():
+        if 'email' not in signed_in:
+            return {"is_logged_in": False}
+        return {"is_logged_in": True, **signed_in}
+
+    monkeypatch.setattr(streamlit.user_info, "_get_user_info", user_info)
+    st.cache_resource.clear()
+    yield signed_in
+    st.cache_resource.clear()
+
+
+def _session():
+    """Start an app session and initialize the system"""
+    session = AppTest.from_file(APP, default_timeout=60)
+    session.run()
+    next(b for b in session.button if "Initialize" in b.label).click().run()
+    assert not session.exception
+    return session
+
+
+def _translate(session, text):
+    session.text_area[0].input(text).run()
+    next(b for b in session.button if "Translate Text" in b.label).click().run()
+    assert not session.exception
+
+
+def test_history_persists_across_sessions_of_a_signed_in_user(user):
+    user['email'] = "analyst@example.com"
+    _translate(_session(), SAMPLE)
+
+    later = _session()
+    assert [entry['original'] for entry in later.session_state.translation_history] == [SAMPLE]
+
+    user['email'] = "someone.else@example.com"
+    assert len(_session().session_state.translation_history) == 0
+
+
+def test_anonymous_history_stays_in_the_session(user):
+    first = _session()
+    _translate(first, SAMPLE)
+    assert len(first.session_state.translation_history) == 1
+
+    assert len(_session().session_state.translation_history) == 0
+    assert not os.path.exists(os.path.join(".translation_cache", "histories"))
@@ -0,0 +1,58 @@
+"""
+Splitting oversized blocks into pieces that fit the completion budget
+"""
+
+import pytest
+import tiktoken
+
+from core.models import TranslationConfig
+from providers.azure_translator import AzureOpenAITranslator
+
+
+# One token per byte, so limits are easy to reason about and nothing is downloaded
+BYTE_ENCODING = tiktoken.core.Encoding(
+    "bytes",
+    pat_str=r"""\S+|\s+""",
+    mergeable_ranks={bytes([i]): i for i in range(256)},
+    special_tokens={"<|endoftext|>": 256}
+)
+
+ADVISORY = (
+    "VMware ESXi contains an out-of-bounds write vulnerability. "
+    "A malicious actor with local administrative privileges may exploit this issue. "
+    "VMware ESXiには境界外書き込みの脆弱性が存在します。"
+    "ローカル管理者権限を持つ攻撃者がこの問題を悪用する可能性があります。"
+    "Apply the updates listed in the Fixed Version column. "
+)
+
+
+@pytest.fixture
+def translator():
+    """A translator with only the tokenizer set up, without any client"""
+    translator = object.__new__(AzureOpenAITranslator)
+    translator.config = TranslationConfig()
+    translator._encoding = BYTE_ENCODING
+    return translator
+
+
+@pytest.mark.parametrize("limit", [8, 40, 100])
+def test_split_oversized_pieces_fit_and_rejoin(translator, limit):
+    pieces = translator._split_oversized(ADVISORY, limit)
+    assert len(pieces) > 1
+    assert all(translator.count_tokens(piece) <= limit for piece in pieces)
+    assert "".join(pieces) == ADVISORY
+
+
+def test_text_within_limit_is_not_split(translator):
+    assert translator._split_oversized(ADVISORY, translator.count_tokens(ADVISORY)) == [ADVISORY]
+
+
+def test_long_sentence_is_split_at_character_boundaries(translator):
+    """Three-byte characters are never cut, so windows hold fewer tokens rather than half a character"""
+    sentence = "ローカル管理者権限を持つ攻撃者がこの問題を悪用する可能性があります"
+    pieces = translator._split_by_tokens(sentence, 10)
+    assert len(pieces) > 1
+    assert "".join(pieces) == sentence
+    for piece in pieces:
+        assert BYTE_ENCODING.decode(BYTE_ENCODING.encode_ordinary(piece)) == piece
+        assert 0 < translator.count_tokens(piece) <= 10
@@ -0,0 +1,14 @@
+"""
+Translation cache keys
+"""
+
+from providers.translation_cache import TranslationCache
+
+
+def test_key_covers_prompt_context_and_temperature():
+    """Changing anything sent to the model besides the text gives a new key"""
+    base = dict(system_prompt="prompt", context="context", temperature=0.1)
+    key = TranslationCache.make_key("text", "gpt-4o", "ja", **base)
+    assert key == TranslationCache.make_key("text", "gpt-4o", "ja", **base)
+    for change in ({'system_prompt': "prompt v2"}, {'context': ""}, {'temperature': 0.2}):
+        assert key != TranslationCache.make_key("text", "gpt-4o", "ja", **{**base, **change})